@@ -3,44 +3,126 @@ Shared utilities for the newsletter system.
 High bar for inclusion - only genuinely platform-agnostic code.
 """
 
+from __future__ import annotations
+
 import sqlite3
-import smtplib
-import base64
+import atexit
 import os
 import logging
-from datetime import datetime
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import logging.handlers
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Dict
-from urllib.parse import urlparse
+from typing import Optional, Dict, List, Iterable, Tuple, TYPE_CHECKING
 
-import yaml
+# yaml, smtplib and email.mime are slow to import and only needed by a few
+# functions, so they are imported lazily where used
+if TYPE_CHECKING:
+    import smtplib
 
 # Configuration will be loaded via load_full_config() function
 
+# Resolved once; set_up_logging configures this same logger object
+_LOG = logging.getLogger('newsletter')
+
+# Background thread that writes queued log records to the console/file handlers
+_LOG_LISTENER = None
+
+DB_PATH = Path(__file__).parent / 'newsletter.db'
+
+# Applied to every connection: WAL journaling with synchronous=NORMAL does one
+# sequential WAL append per commit instead of two fsyncs in rollback mode.
+SQLITE_PRAGMAS = '''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+'''
+
+# Stored in PRAGMA user_version once init_database has run. Bump it whenever
+# the schema below changes so existing databases pick up the migration.
+SCHEMA_VERSION = 6
+
+_DB_INITIALIZED = False
+
+# Shared database connection reused by every helper (opened once per run).
+# The lock also serializes multi-statement transactions across threads.
+_DB = None
+_DB_LOCK = threading.RLock()
+
+# Shared Mailer reused across send_email calls (one login per run)
+_MAILER = None
+_MAILER_LOCK = threading.Lock()
+
+# Characters that break image URLs when used in filenames
+_FILENAME_SANITIZE_TABLE = str.maketrans({'#': '_', '?': '_', '&': '_'})
+
+# Image extensions recognised at the end of a URL path (before any query/fragment)
+_URL_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+# Image MIME type (content-type without parameters) -> file extension
+_EXT_FROM_CONTENT_TYPE = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/pjpeg': '.jpg',
+    'image/png': '.png',
+    'image/x-png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp'
+}
+
+# (date ordinal, 'YYYY-MM-DD') for the current date folder, and the date
+# directories (local and on the image server) already created this process
+_DATE_CACHE = (None, None)
+_CREATED_DATE_DIRS = set()
+
+# (source st_dev, destination directory) pairs where os.link failed, e.g.
+# EXDEV across filesystems, so later uploads go straight to copying
+_NO_HARDLINK_DIRS = set()
+
+
+def _load_yaml(path) -> Dict:
+    """Parse a YAML file, preferring the libyaml-backed loader"""
+    import yaml
+    try:
+        # libyaml-backed loader is several times faster than the pure-Python one
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    return yaml.load(Path(path).read_bytes(), Loader=SafeLoader)
+
+
+def _merge_dicts(base: Dict, overlay: Dict) -> Dict:
+    """Deep-merge overlay into a copy of base; overlay wins for overlapping keys.
+
+    Iterative, and only copies the nested dicts that are actually merged into.
+    """
+    result = dict(base)
+    stack = [(result, overlay)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                dst[key] = dict(dst[key])
+                stack.append((dst[key], value))
+            else:
+                dst[key] = value
+    return result
+
 
 def load_full_config(config_path: str, secrets_path: str) -> Dict:
     """Load and merge configuration from config and secrets files"""
     # Load non-sensitive config
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = _load_yaml(config_path)
     
     # Load sensitive config
-    with open(secrets_path, 'r') as f:
-        secrets = yaml.safe_load(f)
+    secrets = _load_yaml(secrets_path)
     
     # Merge configs - secrets override config for overlapping keys
-    def merge_dicts(base: Dict, overlay: Dict) -> Dict:
-        result = base.copy()
-        for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = merge_dicts(result[key], value)
-            else:
-                result[key] = value
-        return result
-    
-    return merge_dicts(config, secrets)
+    return _merge_dicts(config, secrets)
 
 
 def set_up_logging(platform: str) -> logging.Logger:
@@ -57,7 +139,8 @@ def set_up_logging(platform: str) -> logging.Logger:
     logger = logging.getLogger('newsletter')
     logger.setLevel(logging.INFO)
 
-    # Clear any existing handlers to avoid duplicates
+    # Flush any previous run's listener, then clear handlers to avoid duplicates
+    stop_logging()
     logger.handlers.clear()
 
     # Create formatters
@@ -68,13 +151,20 @@ def set_up_logging(platform: str) -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # File handler
     file_handler = logging.FileHandler(log_filename, encoding='utf-8')
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # Logging calls only enqueue the record; a background listener does the
+    # console and disk writes so the pipeline never blocks on log I/O
+    global _LOG_LISTENER
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _LOG_LISTENER = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True)
+    _LOG_LISTENER.start()
 
     # Log startup info
     logger.info(f"Newsletter run started: {platform} platform")
@@ -82,6 +172,15 @@ def set_up_logging(platform: str) -> logging.Logger:
     return logger
 
 
+@atexit.register
+def stop_logging():
+    """Flush queued log records and stop the background logging listener"""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+
 def log_or_print(message: str, level: str = 'info', logger=None):
     """Log message to logger if available, otherwise print to console"""
     if logger:
@@ -90,12 +189,98 @@ def log_or_print(message: str, level: str = 'info', logger=None):
         print(message)
 
 
+def connect_database(db_path: Path = DB_PATH, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open the newsletter database in autocommit mode with performance PRAGMAs applied.
+
+    Callers manage transactions explicitly with BEGIN/COMMIT.
+    """
+    conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=check_same_thread)
+    conn.executescript(SQLITE_PRAGMAS)
+    return conn
+
+
+def get_database() -> sqlite3.Connection:
+    """Return the shared database connection, opening it on first use.
+
+    The connection may be used from worker threads (sqlite3 serializes
+    access), so it is opened with check_same_thread=False.
+    """
+    global _DB
+    with _DB_LOCK:
+        if _DB is None:
+            _DB = connect_database(check_same_thread=False)
+        return _DB
+
+
+def close_database():
+    """Close the shared database connection; call once when the run is finished.
+
+    Runs PRAGMA optimize first so SQLite refreshes planner statistics for the
+    indexes above after the run's inserts (a no-op when nothing changed).
+    """
+    global _DB
+    with _DB_LOCK:
+        if _DB is not None:
+            if _DB_INITIALIZED:
+                _DB.execute('PRAGMA optimize;')
+            _DB.close()
+            _DB = None
+
+
+@contextmanager
+def database_transaction():
+    """Run statements on the shared connection inside one BEGIN/COMMIT.
+
+    Holds the database lock for the duration, so transactions started from
+    different threads never interleave on the shared connection.
+    """
+    with _DB_LOCK:
+        conn = get_database()
+        conn.execute('BEGIN')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+
 def init_database():
     """Initialize SQLite database with all tables"""
-    db_path = Path(__file__).parent / 'newsletter.db'
-    with sqlite3.connect(str(db_path)) as conn:
-        # Twitter/tweets table
-        conn.execute('''
+    global _DB_INITIALIZED
+    if _DB_INITIALIZED and DB_PATH.exists():
+        return
+
+    conn = get_database()
+    try:
+        # Schema already current (set up by an earlier run or another process)
+        if conn.execute('PRAGMA user_version;').fetchone()[0] >= SCHEMA_VERSION:
+            _DB_INITIALIZED = True
+            return
+
+        # Backfill new columns for existing databases. A fresh database has no
+        # tweets table yet, and the CREATE TABLE below already has every column.
+        # Columns added by ALTER TABLE are appended to the stored CREATE TABLE
+        # text, so a substring check against it stands in for PRAGMA table_info.
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tweets';").fetchone()
+        tweets_sql = row[0] if row else None
+        backfill_columns = [
+            ('video_attachments', 'TEXT'),
+            ('first_seen', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+            ('included_in_newsletter', 'BOOLEAN DEFAULT FALSE'),
+            ('llm_reason', 'TEXT'),
+        ]
+        backfill_sql = ''.join(
+            f'ALTER TABLE tweets ADD COLUMN {column} {ddl};\n'
+            for column, ddl in backfill_columns
+            if tweets_sql and column not in tweets_sql
+        )
+
+        # All DDL runs as a single script inside one transaction (one commit)
+        conn.executescript(f'''
+            BEGIN;
+
+            -- Twitter/tweets table
             CREATE TABLE IF NOT EXISTS tweets (
                 id TEXT PRIMARY KEY,
                 handle TEXT,
@@ -122,22 +307,15 @@ def init_database():
                 first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 included_in_newsletter BOOLEAN DEFAULT FALSE,
                 llm_reason TEXT
-            )
-        ''')
+            );
 
-        # Backfill new columns for existing databases
-        existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(tweets);").fetchall()}
-        if 'video_attachments' not in existing_columns:
-            conn.execute('ALTER TABLE tweets ADD COLUMN video_attachments TEXT')
-        if 'first_seen' not in existing_columns:
-            conn.execute('ALTER TABLE tweets ADD COLUMN first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
-        if 'included_in_newsletter' not in existing_columns:
-            conn.execute('ALTER TABLE tweets ADD COLUMN included_in_newsletter BOOLEAN DEFAULT FALSE')
-        if 'llm_reason' not in existing_columns:
-            conn.execute('ALTER TABLE tweets ADD COLUMN llm_reason TEXT')
-        
-        # Discord tables (for future use)
-        conn.execute('''
+            {backfill_sql}
+            -- Per-handle, time-ordered lookups (id lookups already use the primary key index)
+            CREATE INDEX IF NOT EXISTS idx_tweets_handle_published ON tweets(handle, published);
+            -- Recently stored posts (newsletter selection and reporting)
+            CREATE INDEX IF NOT EXISTS idx_tweets_first_seen ON tweets(first_seen);
+
+            -- Discord tables (for future use)
             CREATE TABLE IF NOT EXISTS discord_messages (
                 id TEXT PRIMARY KEY,
                 channel_id TEXT,
@@ -153,10 +331,34 @@ def init_database():
                 first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 included_in_newsletter BOOLEAN DEFAULT FALSE,
                 llm_reason TEXT
-            )
-        ''')
-        
-        conn.execute('''
+            );
+
+            -- Downloaded media by source URL, so repeat URLs skip the download/upload
+            CREATE TABLE IF NOT EXISTS image_cache (
+                url TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                server_url TEXT,
+                cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- Last downloaded profile picture per handle, with HTTP validators for conditional GETs
+            CREATE TABLE IF NOT EXISTS profile_pics (
+                handle TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                path TEXT NOT NULL,
+                server_url TEXT,
+                cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- Parsed quoted-tweet pages (JSON) by normalized status URL
+            CREATE TABLE IF NOT EXISTS quote_cache (
+                url TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
             CREATE TABLE IF NOT EXISTS discord_summaries (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 date DATE,
@@ -166,26 +368,206 @@ def init_database():
                 message_ids TEXT,
                 block_number INTEGER,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+            );
+
+            PRAGMA user_version = {SCHEMA_VERSION};
+
+            COMMIT;
         ''')
-        
-        conn.commit()
+        _DB_INITIALIZED = True
+    except sqlite3.Error:
+        # The connection is shared, so don't leave a failed migration's transaction open
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+
+
+def get_cached_images(urls: Iterable[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+    """Return {url: (local_path, server_url)} for cached URLs whose file still exists.
+
+    Always empty when the database is not in use for this run (--no-db).
+    """
+    if not _DB_INITIALIZED:
+        return {}
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    cached = {}
+    conn = get_database()
+    for start in range(0, len(unique_urls), 900):
+        chunk = unique_urls[start:start + 900]
+        placeholders = ','.join('?' * len(chunk))
+        rows = conn.execute(f'SELECT url, path, server_url FROM image_cache WHERE url IN ({placeholders})', chunk)
+        cached.update((url, (path, server_url)) for url, path, server_url in rows if os.path.exists(path))
+    return cached
+
+
+def cache_images(entries: Iterable[Tuple[str, str, Optional[str]]]):
+    """Record (url, local_path, server_url) for downloaded media."""
+    if not _DB_INITIALIZED:
+        return
+    rows = [entry for entry in entries if entry[0] and entry[1]]
+    if not rows:
+        return
+    with database_transaction() as conn:
+        conn.executemany('INSERT OR REPLACE INTO image_cache (url, path, server_url) VALUES (?, ?, ?)', rows)
+
+
+def get_cached_profile_pic(handle: str, max_age_hours: Optional[float] = None) -> Optional[Dict[str, Optional[str]]]:
+    """Return the stored profile picture row for handle if its file still exists.
+
+    The dict has url, etag, last_modified, path, server_url and age_hours
+    (time since the row was stored or last revalidated). With max_age_hours,
+    older rows are ignored. Always None when the database is not in use for
+    this run (--no-db).
+    """
+    if not _DB_INITIALIZED:
+        return None
+    query = ("SELECT url, etag, last_modified, path, server_url, (julianday('now') - julianday(cached_at)) * 24"
+             " FROM profile_pics WHERE handle = ?")
+    params = (handle,)
+    if max_age_hours is not None:
+        query += " AND cached_at >= datetime('now', ?)"
+        params += (f'-{max_age_hours} hours',)
+    row = get_database().execute(query, params).fetchone()
+    if not row or not os.path.exists(row[3]):
+        return None
+    return dict(zip(('url', 'etag', 'last_modified', 'path', 'server_url', 'age_hours'), row))
+
+
+def cache_profile_pic(handle: str, url: str, etag: Optional[str], last_modified: Optional[str],
+                      path: str, server_url: Optional[str]):
+    """Record the profile picture downloaded for handle and its HTTP validators."""
+    if not _DB_INITIALIZED:
+        return
+    with database_transaction() as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO profile_pics (handle, url, etag, last_modified, path, server_url) VALUES (?, ?, ?, ?, ?, ?)',
+            (handle, url, etag, last_modified, path, server_url),
+        )
+
+
+def get_cached_quote(url: str, max_age_hours: float) -> Optional[str]:
+    """Return the stored JSON content for a quoted tweet URL if younger than max_age_hours."""
+    if not _DB_INITIALIZED:
+        return None
+    row = get_database().execute(
+        "SELECT content FROM quote_cache WHERE url = ? AND cached_at >= datetime('now', ?)",
+        (url, f'-{max_age_hours} hours'),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def cache_quote(url: str, content: str):
+    """Store the JSON content parsed from a quoted tweet page."""
+    if not _DB_INITIALIZED:
+        return
+    with database_transaction() as conn:
+        conn.execute('INSERT OR REPLACE INTO quote_cache (url, content) VALUES (?, ?)', (url, content))
+
+
+class Mailer:
+    """SMTP session that connects and logs in once, then sends any number of messages.
+
+    The connection is opened lazily on the first send() and reopened once
+    if the server dropped it while idle. Use as a context manager (or call
+    close()) to QUIT when done.
+    """
+
+    def __init__(self, config: Dict):
+        email_config = config.get('email', {})
+        self.host = email_config.get('smtp_host')
+        self.port = email_config.get('smtp_port', 587)
+        self.user = email_config.get('smtp_user')
+        self._password = email_config.get('smtp_pass')
+        self._server = None
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> tuple:
+        """Identifies the account this session is logged in to"""
+        return (self.host, self.port, self.user)
+
+    def __enter__(self) -> Mailer:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send(self, msg):
+        """Send an email.message.Message over the shared session"""
+        import smtplib
+
+        with self._lock:
+            try:
+                self._connection().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Server closed the idle connection between sends - reconnect once
+                self._disconnect()
+                self._connection().send_message(msg)
+
+    def close(self):
+        """QUIT the SMTP session if one is open"""
+        with self._lock:
+            self._disconnect()
+
+    def _connection(self) -> smtplib.SMTP:
+        import smtplib
+
+        if self._server is None:
+            server = smtplib.SMTP(self.host, self.port)
+            server.starttls()
+            server.login(self.user, self._password)
+            self._server = server
+        return self._server
+
+    def _disconnect(self):
+        import smtplib
+
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass  # Connection already gone
+            self._server = None
+
+
+def _get_mailer(config: Dict) -> Mailer:
+    """Return the shared Mailer for config's SMTP account, replacing one for another account."""
+    global _MAILER
+    mailer = Mailer(config)
+    with _MAILER_LOCK:
+        if _MAILER is not None and _MAILER.key != mailer.key:
+            _MAILER.close()
+            _MAILER = None
+        if _MAILER is None:
+            _MAILER = mailer
+        return _MAILER
+
+
+def close_smtp():
+    """Close the shared SMTP connection; call once when the run is finished."""
+    global _MAILER
+    with _MAILER_LOCK:
+        if _MAILER is not None:
+            _MAILER.close()
+            _MAILER = None
 
 
 def send_email(text_content: str, html_content: str, subject: str = None, recipient_email: str = None, config: Dict = None, logger=None):
     """Send email via SMTP - generic email sender"""
-    if logger is None:
-        logger = logging.getLogger('newsletter')
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    logger = logger or _LOG
 
     if not config:
         raise ValueError("Configuration required for sending email")
 
-    smtp_host = config.get('email', {}).get('smtp_host')
-    smtp_port = config.get('email', {}).get('smtp_port', 587)
-    smtp_user = config.get('email', {}).get('smtp_user')
-    smtp_pass = config.get('email', {}).get('smtp_pass')
+    email_config = config.get('email', {})
+    smtp_host = email_config.get('smtp_host')
+    smtp_user = email_config.get('smtp_user')
+    smtp_pass = email_config.get('smtp_pass')
     mail_to = recipient_email
-    mail_from = config.get('email', {}).get('mail_from')
+    mail_from = email_config.get('mail_from')
 
     if not all([smtp_host, smtp_user, smtp_pass, mail_to, mail_from]):
         raise ValueError("Missing email configuration in config files")
@@ -205,73 +587,115 @@ def send_email(text_content: str, html_content: str, subject: str = None, recipi
     msg.attach(text_part)
     msg.attach(html_part)
     
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.starttls()
-        server.login(smtp_user, smtp_pass)
-        server.send_message(msg)
+    _get_mailer(config).send(msg)
     logger.info(f"Email sent successfully to {mail_to}")
 
 
-def image_to_base64(image_path: str) -> Optional[str]:
-    """Convert image file to base64 data URL for embedding in email"""
-    if not image_path or not Path(image_path).exists():
-        return None
-    
-    try:
-        with open(image_path, 'rb') as f:
-            image_data = f.read()
-        
-        # Determine MIME type from extension
-        ext = Path(image_path).suffix.lower()
-        mime_types = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg', 
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }
-        mime_type = mime_types.get(ext, 'image/jpeg')
-        
-        # Convert to base64
-        base64_data = base64.b64encode(image_data).decode('utf-8')
-        return f"data:{mime_type};base64,{base64_data}"
-    
-    except Exception as e:
-        logger = logging.getLogger('newsletter')
-        logger.warning(f"Failed to convert {image_path} to base64: {e}")
-        return None
-
-
 def get_image_extension(url: str, headers: Dict[str, str]) -> str:
     """Extract file extension from URL or content-type"""
-    # Try URL first
-    parsed = urlparse(url)
-    path = parsed.path
-    if '.' in path:
-        ext = Path(path).suffix
-        if ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-            return ext
-    
-    # Fallback to content-type
-    content_type = headers.get('content-type', '').lower()
-    if 'jpeg' in content_type:
-        return '.jpg'
-    elif 'png' in content_type:
-        return '.png'
-    elif 'gif' in content_type:
-        return '.gif'
-    elif 'webp' in content_type:
-        return '.webp'
-    
-    return '.jpg'  # Default fallback
+    # Try URL first: whatever follows the last '.' of the path
+    path = url.partition('?')[0].partition('#')[0]
+    ext = path[path.rfind('.'):].lower()
+    if ext in _URL_IMAGE_EXTS:
+        return ext
+
+    # Fallback to content-type, defaulting to .jpg
+    content_type = headers.get('content-type', '').partition(';')[0].strip().lower()
+    return _EXT_FROM_CONTENT_TYPE.get(content_type, '.jpg')
+
+
+def today_folder() -> str:
+    """Return today's 'YYYY-MM-DD' image folder name, formatted once per day"""
+    global _DATE_CACHE
+    today = date.today()
+    if _DATE_CACHE[0] != today.toordinal():
+        _DATE_CACHE = (today.toordinal(), today.strftime('%Y-%m-%d'))
+    return _DATE_CACHE[1]
+
+
+def today_images_dir() -> Path:
+    """Return the local images/YYYY-MM-DD download directory, creating it on first use"""
+    return _ensure_date_dir('images', today_folder())
+
+
+def _ensure_date_dir(base_dir: str, date_folder: str) -> Path:
+    """Return base_dir/date_folder, creating it only the first time it is seen this run"""
+    dest_dir = Path(base_dir) / date_folder
+    if dest_dir not in _CREATED_DATE_DIRS:
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        _CREATED_DATE_DIRS.add(dest_dir)
+    return dest_dir
+
+
+def _place_image_file(source_path: Path, dest_path: Path, source_stat: os.stat_result,
+                      allow_link: bool = True) -> bool:
+    """Put source_path at dest_path without copying bytes when possible.
+
+    Hardlinks when both paths share a filesystem, otherwise tries an
+    in-kernel copy_file_range before falling back to a buffered copy. The
+    file is staged under a unique temporary name and renamed into place, so
+    concurrent placements never touch each other's staging file and an
+    existing dest_path (possibly a hardlink to the source itself) is
+    replaced rather than truncated in place. source_stat is the caller's
+    os.stat of source_path; allow_link=False forces a copy. Returns True when
+    dest_path ends up as a hardlink to the source.
+    """
+    import errno
+    import secrets
+    import shutil
+    import tempfile
+
+    link_key = (source_stat.st_dev, dest_path.parent)
+    if allow_link and link_key not in _NO_HARDLINK_DIRS:
+        tmp_path = dest_path.with_name(f".{dest_path.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            os.link(source_path, tmp_path)
+        except OSError as e:
+            # Only a cross-device or unsupported link means this directory never can
+            if e.errno in (errno.EXDEV, errno.EPERM):
+                _NO_HARDLINK_DIRS.add(link_key)
+        else:
+            try:
+                os.replace(tmp_path, dest_path)
+            finally:
+                # rename() is a no-op when dest_path is already this inode, leaving tmp_path behind
+                tmp_path.unlink(missing_ok=True)
+            return True
+
+    # mkstemp creates a brand-new file, so the copy can never write through a link to the source
+    fd, tmp_name = tempfile.mkstemp(dir=dest_path.parent, prefix=f".{dest_path.name}.", suffix='.tmp')
+    try:
+        with open(source_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            try:
+                remaining = source_stat.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining > 0:
+                    raise OSError("copy_file_range stopped short")
+            except (AttributeError, OSError):
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                shutil.copyfileobj(src, dst)
+        os.replace(tmp_name, dest_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return False
 
 
 def upload_to_image_server(image_path: str, config: Dict = None, logger=None) -> Optional[str]:
     """Copy image to self-hosted server and return the URL"""
-    if logger is None:
-        logger = logging.getLogger('newsletter')
+    logger = logger or _LOG
 
-    if not image_path or not Path(image_path).exists():
+    if not image_path:
+        return None
+    try:
+        source_stat = os.stat(image_path)
+    except OSError:
         return None
 
     if not config:
@@ -286,26 +710,38 @@ def upload_to_image_server(image_path: str, config: Dict = None, logger=None) ->
         return None
     
     try:
-        import shutil
         source_path = Path(image_path)
         
         # Create date-based subdirectory
-        date_folder = datetime.now().strftime('%Y-%m-%d')
-        dest_dir = Path(image_server_path) / date_folder
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        date_folder = today_folder()
+        dest_dir = _ensure_date_dir(image_server_path, date_folder)
         
         # Generate filename (sanitize for web URLs)
-        filename = source_path.name.replace('#', '_').replace('?', '_').replace('&', '_')
+        filename = source_path.name.translate(_FILENAME_SANITIZE_TABLE)
         dest_path = dest_dir / filename
+        public_url = f"{image_server_url}/{date_folder}/{filename}"
+
+        # A hardlink shares the source's inode and mode, so only link a source
+        # nginx can already read (0644 under the standard 022 umask); anything
+        # else is copied, leaving the downloaded file's permissions untouched
+        servable = source_stat.st_mode & 0o777 == 0o644
+
+        try:
+            dest_stat = os.stat(dest_path)
+        except OSError:
+            dest_stat = None
+        if (servable and dest_stat
+                and (dest_stat.st_dev, dest_stat.st_ino) == (source_stat.st_dev, source_stat.st_ino)):
+            return public_url  # Already hardlinked by an earlier upload, so contents are current
+        if (dest_stat and dest_stat.st_size == source_stat.st_size
+                and dest_stat.st_mtime >= source_stat.st_mtime and dest_stat.st_mode & 0o777 == 0o644):
+            return public_url  # Copied by an earlier upload and the source hasn't changed since
         
-        # Copy file to image server directory
-        shutil.copy2(source_path, dest_path)
-        
-        # Make sure nginx can read it
-        os.chmod(dest_path, 0o644)
+        # Link (or copy) file into image server directory
+        linked = _place_image_file(source_path, dest_path, source_stat, allow_link=servable)
+        if not linked:
+            os.chmod(dest_path, 0o644)  # Make sure nginx can read the copy
         
-        # Return public URL
-        public_url = f"{image_server_url}/{date_folder}/{filename}"
         logger.info(f"Uploaded {filename} to image server: {public_url}")
         return public_url
 
@@ -314,8 +750,17 @@ def upload_to_image_server(image_path: str, config: Dict = None, logger=None) ->
         return None
 
 
+def upload_many(image_paths: List[Optional[str]], config: Dict = None, logger=None,
+                max_workers: int = 8) -> List[Optional[str]]:
+    """Upload several images in parallel, returning URLs aligned with image_paths"""
+    if len(image_paths) <= 1:
+        return [upload_to_image_server(path, config, logger=logger) for path in image_paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(image_paths))) as executor:
+        return list(executor.map(lambda path: upload_to_image_server(path, config, logger=logger), image_paths))
+
+
 def load_accounts_config() -> Dict:
     """Load accounts configuration from accounts.yaml"""
     accounts_path = Path(__file__).parent / 'accounts.yaml'
-    with open(accounts_path, 'r') as f:
-        return yaml.safe_load(f)
+    return _load_yaml(accounts_path)
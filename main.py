@@ -6,7 +6,7 @@ Routes to platform-specific implementations based on CLI flags.
 
 import argparse
 import sys
-from common_utils import set_up_logging
+from common_utils import set_up_logging, close_smtp, close_database
 
 
 def main():
@@ -47,15 +47,20 @@ def main():
     account_lists_filter = None
 
     # Route to platform-specific implementation
-    if args.platform == 'twitter':
-        import twitter
-        twitter.main(dry_run=args.dry_run, window_hours=args.window, no_db=args.no_db,
-                    recipient_email=args.to, config_path=args.config, secrets_path=args.secrets,
-                    account_lists_filter=account_lists_filter, logger=logger)
-    elif args.platform == 'discord':
-        # Future implementation
-        logger.info("Discord support coming soon! Use --platform=twitter for now.")
-        return
+    try:
+        if args.platform == 'twitter':
+            import twitter
+            twitter.main(dry_run=args.dry_run, window_hours=args.window, no_db=args.no_db,
+                        recipient_email=args.to, config_path=args.config, secrets_path=args.secrets,
+                        account_lists_filter=account_lists_filter, logger=logger)
+        elif args.platform == 'discord':
+            # Future implementation
+            logger.info("Discord support coming soon! Use --platform=twitter for now.")
+            return
+    finally:
+        # Newsletters share one SMTP session; log out once everything is sent
+        close_smtp()
+        close_database()
 
     logger.info("Newsletter processing complete!")
 
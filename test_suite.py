@@ -6,13 +6,32 @@ Run with: python test_suite.py
 
 import sys
 import json
+import os
+import shutil
+import tempfile
+import threading
+import time
 import traceback
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from pathlib import Path
 
+import httpx
 from bs4 import BeautifulSoup
 
 sys.path.append('.')
 
+import common_utils
+import twitter
+from common_utils import (
+    cache_images,
+    cache_profile_pic,
+    cache_quote,
+    get_cached_images,
+    get_cached_profile_pic,
+    get_cached_quote,
+    upload_to_image_server,
+)
 from twitter import (
     Post,
     extract_quote_tweet_url_from_text,
@@ -22,6 +41,12 @@ from twitter import (
     normalize_nitter_status_url,
     find_nested_quote_url,
     parse_media_from_description,
+    parse_nitter_rss,
+    _parse_nitter_timestamp,
+    PAGE_HTML_PARSER,
+    fetch_basic_quote_content,
+    _quote_cache_key,
+    _json_dumps,
 )
 
 class TestResult:
@@ -121,6 +146,54 @@ class TestResult:
             return True
 
 
+@contextmanager
+def temporary_database():
+    """Point common_utils at a fresh database in a temp dir; yields the dir"""
+    tmp_dir = Path(tempfile.mkdtemp())
+    saved = (common_utils.DB_PATH, common_utils._DB, common_utils._DB_INITIALIZED)
+    common_utils.DB_PATH = tmp_dir / 'newsletter.db'
+    common_utils._DB = common_utils.connect_database(common_utils.DB_PATH, check_same_thread=False)
+    common_utils._DB_INITIALIZED = False
+    try:
+        common_utils.init_database()
+        yield tmp_dir
+    finally:
+        common_utils.close_database()
+        common_utils.DB_PATH, common_utils._DB, common_utils._DB_INITIALIZED = saved
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@contextmanager
+def patched(module, **attrs):
+    """Temporarily replace module attributes"""
+    saved = {name: getattr(module, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+@contextmanager
+def stubbed_http(handler):
+    """Route the shared HTTP client through handler(request) -> httpx.Response; yields the request log"""
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    saved = twitter.HTTP_CLIENT
+    twitter.HTTP_CLIENT = httpx.Client(transport=httpx.MockTransport(record))
+    try:
+        yield requests
+    finally:
+        twitter.HTTP_CLIENT.close()
+        twitter.HTTP_CLIENT = saved
+
+
 def test_nested_quote_functionality():
     """Test nested quote tweet functionality"""
     print("="*50)
@@ -148,7 +221,7 @@ def test_nested_quote_functionality():
         "Preserve absolute Nitter status URL",
     )
 
-    # Nested quote discovery tests
+    # Nested quote discovery tests (parsed like fetched Nitter pages: lxml when installed)
     soup_with_inline_quote = BeautifulSoup(
         """
         <div class="main-tweet">
@@ -157,7 +230,7 @@ def test_nested_quote_functionality():
             </div>
         </div>
         """,
-        "html.parser",
+        PAGE_HTML_PARSER,
     )
     result.assert_equal(
         find_nested_quote_url(soup_with_inline_quote, base_url),
@@ -174,7 +247,7 @@ def test_nested_quote_functionality():
             </div>
         </div>
         """,
-        "html.parser",
+        PAGE_HTML_PARSER,
     )
     result.assert_equal(
         find_nested_quote_url(soup_with_quote_block, base_url),
@@ -409,6 +482,15 @@ def test_quote_timestamp_functionality():
     utc_html = render_quote_html_recursive(quote_utc, depth=0, author_pfps=None, timezone_str="UTC")
     result.assert_contains(utc_html, "10:30 PM · Jan 15, 2025", "Timestamp displayed in UTC when specified")
 
+    print("\n--- Timestamp Parsing Tests ---")
+
+    # Test 7: Nitter status timestamps parse to aware UTC datetimes
+    result.assert_equal(_parse_nitter_timestamp("Feb 15, 2025 · 3:45 PM UTC"),
+                        datetime(2025, 2, 15, 15, 45, tzinfo=timezone.utc), "PM timestamp parsed")
+    result.assert_equal(_parse_nitter_timestamp("Jan 1, 2025 · 12:05 AM UTC"),
+                        datetime(2025, 1, 1, 0, 5, tzinfo=timezone.utc), "12 AM maps to midnight")
+    result.assert_none(_parse_nitter_timestamp("Feb 30, 2025 · 3:45 PM UTC"), "Invalid date yields None")
+
     return result
 
 
@@ -522,6 +604,348 @@ def test_blockquote_stripping():
     return result
 
 
+def test_hostile_description_sanitizing():
+    """Ensure scripts and non-http(s) links in a Nitter description never reach the email."""
+    print("\n==================================================")
+    print("TESTING: Hostile Description Sanitizing")
+    print("==================================================")
+
+    result = TestResult()
+
+    raw = """
+    <p>Hello<script>alert(1)</script><style>p { display: none }</style>
+    <a href="javascript:alert(1)">click me</a>
+    <a href=" JaVa&#x09;Script:alert(2)">sneaky</a>
+    <a href="data:text/html,evil">data link</a>
+    <br onclick="alert(3)">
+    <a href="https://example.com/page">https://example.com/page</a>
+    <a href="/someone/status/1">relative</a></p>
+    """
+    cleaned = format_tweet_body_html(raw)
+    result.assert_true("alert(1)" not in cleaned, "Script contents removed")
+    result.assert_true("display: none" not in cleaned, "Style contents removed")
+    result.assert_true("javascript" not in cleaned.lower(), "javascript: hrefs removed")
+    result.assert_true("data:" not in cleaned, "data: hrefs removed")
+    result.assert_true("onclick" not in cleaned, "Event handler attributes removed")
+    result.assert_contains(cleaned, "click me", "Unsafe link text kept as plain text")
+    result.assert_contains(cleaned, 'href="https://example.com/page"', "https link preserved")
+    result.assert_contains(cleaned, 'href="/someone/status/1"', "Relative link preserved")
+
+    return result
+
+
+def test_quote_cache():
+    """Test the persistent quoted-tweet cache and how fetch_basic_quote_content uses it."""
+    print("\n==================================================")
+    print("TESTING: Quote Cache")
+    print("==================================================")
+
+    result = TestResult()
+    config = {"nitter": {"base_url": "http://nitter.test"}}
+    quote_page = """
+    <div class="main-tweet">
+      <div class="tweet-header"><a class="username">@fresh</a></div>
+      <div class="tweet-content">Fetched from the page</div>
+    </div>
+    """
+
+    result.assert_equal(
+        _quote_cache_key("HTTP://Nitter.Test/Someone/status/1/#m"),
+        "http://nitter.test/Someone/status/1",
+        "Cache key lowercases scheme/host and drops fragment and trailing slash",
+    )
+
+    with temporary_database():
+        cache_quote("http://nitter.test/a/status/1", '["stored"]')
+        result.assert_equal(get_cached_quote("http://nitter.test/a/status/1", max_age_hours=1), '["stored"]',
+                            "cache_quote/get_cached_quote round trip")
+
+        common_utils.get_database().execute(
+            "UPDATE quote_cache SET cached_at = datetime('now', '-2 hours') WHERE url = ?",
+            ("http://nitter.test/a/status/1",))
+        result.assert_none(get_cached_quote("http://nitter.test/a/status/1", max_age_hours=1),
+                           "Entry older than max_age_hours is ignored")
+        result.assert_equal(get_cached_quote("http://nitter.test/a/status/1", max_age_hours=3), '["stored"]',
+                            "Entry within max_age_hours is returned")
+
+        # A stored quote is served without a request, and each caller gets its own media lists
+        cache_quote("http://nitter.test/b/status/2", _json_dumps([
+            "bob", "stored text", ["http://nitter.test/pic/a.jpg"],
+            [{"thumbnail_url": "http://nitter.test/pic/t.jpg", "target_url": None}],
+            None, "2025-01-15T14:30:00+00:00"]))
+        with stubbed_http(lambda request: httpx.Response(200, text=quote_page)) as requests:
+            first = fetch_basic_quote_content("HTTP://Nitter.Test/b/status/2/#m", config)
+            first[2].append("http://nitter.test/pic/extra.jpg")
+            first[3][0]["thumbnail_server_url"] = "https://img/t.jpg"
+            second = fetch_basic_quote_content("http://nitter.test/b/status/2", config)
+        result.assert_equal(len(requests), 0, "Stored quote served without a request")
+        result.assert_equal(second[:2], ("bob", "stored text"), "Stored author and text returned")
+        result.assert_equal(second[5], datetime(2025, 1, 15, 14, 30, tzinfo=timezone.utc), "Stored timestamp parsed")
+        result.assert_equal(second[2], ["http://nitter.test/pic/a.jpg"], "Image list not shared between callers")
+        result.assert_true("thumbnail_server_url" not in second[3][0], "Video dicts not shared between callers")
+
+        # Malformed rows fall back to fetching the page instead of raising
+        cache_quote("http://nitter.test/c/status/3", '["truncated')
+        cache_quote("http://nitter.test/d/status/4", _json_dumps(["x", "y", [], [], None, "not a date"]))
+        with stubbed_http(lambda request: httpx.Response(200, text=quote_page)) as requests:
+            truncated = fetch_basic_quote_content("http://nitter.test/c/status/3", config)
+            bad_date = fetch_basic_quote_content("http://nitter.test/d/status/4", config)
+        result.assert_equal(len(requests), 2, "Malformed rows refetched from the network")
+        result.assert_equal(truncated[:2], ("fresh", "Fetched from the page"), "Truncated JSON row replaced by page content")
+        result.assert_equal(bad_date[:2], ("fresh", "Fetched from the page"), "Unparseable timestamp row replaced by page content")
+        result.assert_contains(get_cached_quote("http://nitter.test/c/status/3", max_age_hours=1), '"fresh"',
+                               "Refetched content overwrites the malformed row")
+
+    return result
+
+
+def test_shared_image_download():
+    """Test that posts sharing an image URL download and upload it once."""
+    print("\n==================================================")
+    print("TESTING: Shared Image Downloads")
+    print("==================================================")
+
+    result = TestResult()
+    shared_url = "http://nitter.test/pic/shared.jpg"
+    broken_url = "http://nitter.test/pic/broken.jpg"
+
+    def handler(request):
+        time.sleep(0.2)  # Keep the owner busy so the other post has to wait on it
+        if str(request.url) == broken_url:
+            raise RuntimeError("connection dropped")
+        return httpx.Response(200, content=b"jpeg bytes", headers={"content-type": "image/jpeg"})
+
+    uploaded = []
+
+    def counting_upload_many(paths, config, logger=None):
+        uploaded.extend(paths)
+        return common_utils.upload_many(paths, config, logger=logger)
+
+    def run_concurrently(calls):
+        outputs = [None] * len(calls)
+
+        def run(index, args):
+            outputs[index] = twitter.download_images(*args)
+
+        threads = [threading.Thread(target=run, args=(i, args)) for i, args in enumerate(calls)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        return outputs, any(thread.is_alive() for thread in threads)
+
+    tmp_dir = Path(tempfile.mkdtemp())
+    config = {"image_server": {"path": str(tmp_dir / "srv"), "url": "https://img"}}
+    (tmp_dir / "images").mkdir()
+    (tmp_dir / "srv").mkdir()
+    try:
+        with patched(twitter, today_images_dir=lambda: tmp_dir / "images", upload_many=counting_upload_many), \
+                stubbed_http(handler) as requests:
+            (first, second), hung = run_concurrently([
+                ("1", "alice", [shared_url, shared_url], config),
+                ("2", "bob", [shared_url], config),
+            ])
+            result.assert_true(not hung, "Shared download does not hang")
+            result.assert_equal([str(r.url) for r in requests], [shared_url], "Shared image downloaded once")
+            result.assert_equal(len(uploaded), 1, "Shared image uploaded once")
+            result.assert_equal(first[0][0], first[0][1], "Duplicate URL in one post reuses the same file")
+            result.assert_equal(second[0], [first[0][0]], "Other post reuses the owner's local path")
+            result.assert_true(first[1][0] is not None and first[1] == [first[1][0]] * 2 and second[1] == [first[1][0]],
+                               "Both posts get the owner's server URL")
+
+            requests.clear()
+            (first, second), hung = run_concurrently([
+                ("3", "alice", [broken_url], config),
+                ("4", "bob", [broken_url], config),
+            ])
+            result.assert_true(not hung, "Failed shared download does not hang")
+            result.assert_equal(len(requests), 1, "Failed image attempted once")
+            result.assert_equal((first, second), (([None], [None]), ([None], [None])),
+                                "Failed download leaves both posts without the image")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return result
+
+
+def test_image_cache():
+    """Test that image_cache rows let download_images skip media fetched by an earlier post."""
+    print("\n==================================================")
+    print("TESTING: Image Cache")
+    print("==================================================")
+
+    result = TestResult()
+    cached_url = "http://nitter.test/pic/cached.jpg"
+    deleted_url = "http://nitter.test/pic/deleted.jpg"
+    failing_url = "http://nitter.test/pic/failing.jpg"
+
+    def handler(request):
+        if str(request.url) == failing_url:
+            raise RuntimeError("connection dropped")
+        return httpx.Response(200, content=b"jpeg bytes", headers={"content-type": "image/jpeg"})
+
+    with temporary_database() as tmp_dir:
+        config = {"image_server": {"path": str(tmp_dir / "srv"), "url": "https://img"}}
+        images_dir = tmp_dir / "images"
+        images_dir.mkdir()
+        existing_path = images_dir / "earlier_1.jpg"
+        existing_path.write_bytes(b"earlier bytes")
+
+        cache_images([
+            (cached_url, str(existing_path), "https://img/earlier_1.jpg"),
+            (deleted_url, str(images_dir / "gone.jpg"), "https://img/gone.jpg"),
+            (failing_url, None, None),
+        ])
+        result.assert_equal(set(get_cached_images([cached_url, deleted_url, failing_url])), {cached_url},
+                            "Only rows whose file still exists are returned")
+        stored_urls = {url for url, in common_utils.get_database().execute("SELECT url FROM image_cache")}
+        result.assert_equal(stored_urls, {cached_url, deleted_url}, "Entries without a local path are not written")
+
+        with patched(twitter, today_images_dir=lambda: images_dir), stubbed_http(handler) as requests:
+            hit = twitter.download_images("1", "alice", [cached_url], config)
+            result.assert_equal(len(requests), 0, "Cache hit makes no request")
+            result.assert_equal(hit, ([str(existing_path)], ["https://img/earlier_1.jpg"]),
+                                "Cache hit reuses the stored path and server URL")
+
+            refetched = twitter.download_images("2", "alice", [deleted_url], config)
+            result.assert_equal([str(r.url) for r in requests], [deleted_url], "Row with a deleted file is re-downloaded")
+            result.assert_equal(get_cached_images([deleted_url]).get(deleted_url, (None,))[0], refetched[0][0],
+                                "Re-downloaded file replaces the stale row")
+
+            twitter.download_images("3", "alice", [failing_url], config)
+
+        stored = common_utils.get_database().execute(
+            "SELECT COUNT(*) FROM image_cache WHERE url = ?", (failing_url,)).fetchone()[0]
+        result.assert_equal(stored, 0, "Failed download is not cached")
+
+    return result
+
+
+def test_profile_pic_revalidation():
+    """Test that stored profile pictures are reused while fresh and revalidated with a conditional GET."""
+    print("\n==================================================")
+    print("TESTING: Profile Picture Revalidation")
+    print("==================================================")
+
+    result = TestResult()
+    pic_url = "http://nitter.test/pic/profile.jpg"
+    new_pic_url = "http://nitter.test/pic/profile_new.jpg"
+    last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def handler(request):
+        if str(request.url) == pic_url:
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"new picture",
+                              headers={"content-type": "image/jpeg", "etag": '"v2"'})
+
+    with temporary_database() as tmp_dir:
+        config = {"image_server": {"path": str(tmp_dir / "srv"), "url": "https://img"}}
+        images_dir = tmp_dir / "images"
+        images_dir.mkdir()
+        stored_path = images_dir / "alice_profile_earlier.jpg"
+        stored_path.write_bytes(b"stored picture")
+        cache_profile_pic("alice", pic_url, '"v1"', last_modified, str(stored_path), "https://img/alice.jpg")
+
+        def age_row(hours):
+            common_utils.get_database().execute(
+                "UPDATE profile_pics SET cached_at = datetime('now', ?) WHERE handle = 'alice'", (f"-{hours} hours",))
+
+        with patched(twitter, today_images_dir=lambda: images_dir), stubbed_http(handler) as requests:
+            fresh = twitter.download_profile_pic("alice", pic_url, "20250101_000000", config)
+            result.assert_equal(len(requests), 0, "Fresh stored picture makes no request")
+            result.assert_equal(fresh, (str(stored_path), "https://img/alice.jpg"), "Fresh stored picture reused")
+
+            age_row(25)
+            revalidated = twitter.download_profile_pic("alice", pic_url, "20250101_000000", config)
+            result.assert_equal(len(requests), 1, "Stale stored picture revalidated")
+            result.assert_equal(requests[0].headers.get("if-none-match"), '"v1"', "Stored ETag sent as If-None-Match")
+            result.assert_equal(requests[0].headers.get("if-modified-since"), last_modified,
+                                "Stored Last-Modified sent as If-Modified-Since")
+            result.assert_equal(revalidated, (str(stored_path), "https://img/alice.jpg"), "304 reuses the stored path")
+            result.assert_true(get_cached_profile_pic("alice")["age_hours"] < 1, "304 marks the row freshly validated")
+
+            changed = twitter.download_profile_pic("alice", new_pic_url, "20250101_000000", config)
+            result.assert_true("if-none-match" not in requests[-1].headers, "Changed picture URL fetched unconditionally")
+            result.assert_true(changed[0] != str(stored_path) and Path(changed[0]).read_bytes() == b"new picture",
+                               "Changed picture downloaded to a new file")
+            result.assert_equal(get_cached_profile_pic("alice")["etag"], '"v2"', "New ETag stored")
+
+    return result
+
+
+def test_image_server_placement():
+    """Test how upload_to_image_server links, copies and skips files on the image server."""
+    print("\n==================================================")
+    print("TESTING: Image Server Placement")
+    print("==================================================")
+
+    result = TestResult()
+    tmp_dir = Path(tempfile.mkdtemp())
+    config = {"image_server": {"path": str(tmp_dir / "srv"), "url": "https://img"}}
+    dest_dir = tmp_dir / "srv" / common_utils.today_folder()
+    images_dir = tmp_dir / "images"
+    images_dir.mkdir()
+
+    def make_source(name, data, mode=0o644):
+        path = images_dir / name
+        path.write_bytes(data)
+        os.chmod(path, mode)
+        return path
+
+    def same_inode(a, b):
+        return os.stat(a).st_ino == os.stat(b).st_ino
+
+    def staging_files():
+        return [name for name in os.listdir(dest_dir) if name.endswith(".tmp")]
+
+    try:
+        # Hardlink path, including re-placing over an existing link to the same inode
+        linked_src = make_source("alice_1_1.jpg", b"linked bytes")
+        url = upload_to_image_server(str(linked_src), config)
+        result.assert_equal(url, f"https://img/{common_utils.today_folder()}/alice_1_1.jpg", "Public URL returned")
+        result.assert_true(same_inode(linked_src, dest_dir / "alice_1_1.jpg"), "Same-filesystem upload is a hardlink")
+        upload_to_image_server(str(linked_src), config)
+        result.assert_true(common_utils._place_image_file(linked_src, dest_dir / "alice_1_1.jpg", os.stat(linked_src)),
+                           "Re-placing an already-linked file links again")
+        result.assert_equal(staging_files(), [], "No staging file left after re-linking")
+
+        # Copy fallback, forced by marking the directory as unable to hardlink
+        copied_src = make_source("alice_2_1.jpg", b"copied bytes")
+        link_key = (os.stat(copied_src).st_dev, dest_dir)
+        common_utils._NO_HARDLINK_DIRS.add(link_key)
+        try:
+            upload_to_image_server(str(copied_src), config)
+            copied_dest = dest_dir / "alice_2_1.jpg"
+            result.assert_true(not same_inode(copied_src, copied_dest), "Copy fallback used when linking is off")
+            result.assert_equal(copied_dest.read_bytes(), b"copied bytes", "Copied contents match")
+            result.assert_equal(os.stat(copied_dest).st_mode & 0o777, 0o644, "Copy is world-readable")
+
+            inode = os.stat(copied_dest).st_ino
+            upload_to_image_server(str(copied_src), config)
+            result.assert_equal(os.stat(copied_dest).st_ino, inode, "Unchanged source is not copied again")
+
+            copied_src.write_bytes(b"edited bytes, longer")
+            future = time.time() + 60
+            os.utime(copied_src, (future, future))
+            upload_to_image_server(str(copied_src), config)
+            result.assert_equal(copied_dest.read_bytes(), b"edited bytes, longer", "Changed source is copied again")
+            result.assert_equal(staging_files(), [], "No staging file left after copying")
+        finally:
+            common_utils._NO_HARDLINK_DIRS.discard(link_key)
+
+        # A source nginx cannot read is copied rather than linked and chmod-ed
+        private_src = make_source("alice_3_1.jpg", b"private bytes", mode=0o600)
+        upload_to_image_server(str(private_src), config)
+        private_dest = dest_dir / "alice_3_1.jpg"
+        result.assert_equal(os.stat(private_src).st_mode & 0o777, 0o600, "Source permissions left untouched")
+        result.assert_true(not same_inode(private_src, private_dest), "Non-0644 source copied, not linked")
+        result.assert_equal(os.stat(private_dest).st_mode & 0o777, 0o644, "Served copy is world-readable")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return result
+
+
 def test_extract_quote_tweet_url():
     """Test _extract_quote_tweet_url via Post construction with various raw_description inputs."""
     print("\n==================================================")
@@ -579,6 +1003,65 @@ def test_extract_quote_tweet_url():
     return result
 
 
+def test_parse_nitter_rss():
+    """Test parsing a Nitter RSS document into entries."""
+    print("\n==================================================")
+    print("TESTING: Nitter RSS Parsing")
+    print("==================================================")
+
+    result = TestResult()
+
+    rss = b'''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>someone / Twitter</title>
+    <image><title>someone</title><url>http://10.8.0.1:8080/pic/profile.jpg</url></image>
+    <item>
+      <title>RT by @someone: Hello &amp; welcome</title>
+      <dc:creator>@original</dc:creator>
+      <description><![CDATA[<p>Hello <a href="/x/status/1">link</a></p>]]></description>
+      <pubDate>Tue, 14 Oct 2025 16:30:00 -0700</pubDate>
+      <guid>http://10.8.0.1:8080/original/status/123#m</guid>
+      <link>http://10.8.0.1:8080/original/status/123#m</link>
+      <media:content url="http://10.8.0.1:8080/pic/a.jpg" type="image/jpeg"/>
+      <media:content url="http://10.8.0.1:8080/video/v.mp4" type="video/mp4"/>
+    </item>
+    <item>
+      <title>No date</title>
+      <link>http://10.8.0.1:8080/someone/status/456#m</link>
+    </item>
+    <item>
+      <title>ISO date</title>
+      <pubDate>2025-10-14T16:30:00-07:00</pubDate>
+    </item>
+    <item>
+      <title>Bad date</title>
+      <pubDate>yesterday</pubDate>
+    </item>
+  </channel>
+</rss>'''
+
+    profile_pic_url, entries = parse_nitter_rss(rss)
+    entries = list(entries)
+    result.assert_equal(profile_pic_url, "http://10.8.0.1:8080/pic/profile.jpg", "Profile picture from channel image")
+    result.assert_equal(len(entries), 4, "All items parsed")
+
+    entry = entries[0]
+    result.assert_equal(entry["title"], "RT by @someone: Hello & welcome", "Title entities unescaped")
+    result.assert_equal(entry["author"], "@original", "Author from dc:creator")
+    result.assert_equal(entry["description"], '<p>Hello <a href="/x/status/1">link</a></p>', "Description HTML kept intact")
+    result.assert_equal(entry["published"], datetime(2025, 10, 14, 23, 30, tzinfo=timezone.utc), "pubDate converted to UTC")
+    result.assert_equal(entry["guid"], "http://10.8.0.1:8080/original/status/123#m", "GUID parsed")
+    result.assert_equal(entry["media_image_urls"], ["http://10.8.0.1:8080/pic/a.jpg"], "Only image media:content kept")
+
+    result.assert_none(entries[1]["published"], "Missing pubDate yields None")
+    result.assert_equal(entries[2]["published"], datetime(2025, 10, 14, 23, 30, tzinfo=timezone.utc), "ISO 8601 pubDate accepted")
+    result.assert_none(entries[3]["published"], "Unparseable pubDate yields None")
+    result.assert_equal(entries[1]["guid"], "", "Missing guid yields empty string")
+
+    return result
+
+
 def run_all_tests():
     """Run all test suites"""
     print("🧪 NEWSLETTER SYSTEM TEST SUITE")
@@ -606,9 +1089,30 @@ def run_all_tests():
         blockquote_result = test_blockquote_stripping()
         all_results.append(blockquote_result)
 
+        hostile_result = test_hostile_description_sanitizing()
+        all_results.append(hostile_result)
+
+        quote_cache_result = test_quote_cache()
+        all_results.append(quote_cache_result)
+
+        shared_image_result = test_shared_image_download()
+        all_results.append(shared_image_result)
+
+        image_cache_result = test_image_cache()
+        all_results.append(image_cache_result)
+
+        profile_pic_result = test_profile_pic_revalidation()
+        all_results.append(profile_pic_result)
+
+        placement_result = test_image_server_placement()
+        all_results.append(placement_result)
+
         extract_quote_url_result = test_extract_quote_tweet_url()
         all_results.append(extract_quote_url_result)
 
+        rss_result = test_parse_nitter_rss()
+        all_results.append(rss_result)
+
     except Exception as e:
         print(f"\n❌ CRITICAL ERROR: Test suite crashed")
         print(f"Error: {e}")
@@ -3,27 +3,134 @@ Twitter-specific functionality for the newsletter system.
 Handles RSS feed fetching, tweet processing, and email generation.
 """
 
+import atexit
 import json
-import sqlite3
 import time
 import re
 import html
+import string
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from urllib.parse import urljoin, urlparse
+from xml.etree import ElementTree
 from zoneinfo import ZoneInfo
 
-import feedparser
 import httpx
 import os
 
 from bs4 import BeautifulSoup, NavigableString
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from common_utils import send_email, upload_to_image_server, get_image_extension, log_or_print
+try:
+    import orjson  # Optional C-accelerated JSON; stdlib json is the fallback
+except ImportError:
+    orjson = None
+try:
+    import lxml  # noqa: F401  Optional C parser for full Nitter pages
+    PAGE_HTML_PARSER = 'lxml'
+except ImportError:
+    PAGE_HTML_PARSER = 'html.parser'
+try:
+    import h2  # noqa: F401  Optional; lets httpx multiplex requests over HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from common_utils import send_email, get_database, database_transaction, get_cached_images, cache_images, get_cached_profile_pic, cache_profile_pic, get_cached_quote, cache_quote, upload_to_image_server, upload_many, get_image_extension, today_images_dir, log_or_print
 
 
 MAX_QUOTE_DEPTH = 3
+MAX_FEED_WORKERS = 8  # Concurrent RSS fetches against the Nitter instance
+MAX_IMAGE_WORKERS = 4  # Concurrent image downloads per post
+MAX_PROFILE_PIC_WORKERS = 8  # Concurrent profile picture lookups/downloads
+MAX_POST_WORKERS = 8  # Posts whose media and quotes are fetched concurrently
+PROFILE_PIC_TTL_HOURS = 24  # Trust a stored profile picture this long without asking Nitter
+QUOTE_CACHE_TTL_HOURS = 7 * 24  # Reuse a parsed quoted tweet from an earlier run this long
+MAX_REQUESTS_PER_HOST = 8  # In-flight HTTP requests per host across all worker pools
+NITTER_PAGES_PER_SECOND = 10  # Sustained rate of Nitter page requests (RSS, quotes, profiles)
+SQLITE_MAX_PARAMS = 900  # Bound parameters per IN (...) query
+RETWEET_TITLE_PREFIX = 'RT by @'  # Nitter RSS titles of retweets
+X_BASE_URL = 'https://x.com'
+TIMESTAMP_DISPLAY_FORMAT = '%I:%M %p · %b %d, %Y'  # Tweet and quote times in the newsletter
+
+# One pooled client for every request, so feed pages, quotes and images reuse
+# keep-alive connections (and gzip responses) instead of a fresh handshake each.
+# HTTPS origins negotiate HTTP/2 when h2 is installed; plain HTTP stays on 1.1.
+HTTP_CLIENT = httpx.Client(
+    timeout=30,
+    headers={'Accept-Encoding': 'gzip, deflate'},
+    # Idle connections survive the gaps between run phases (httpx default is 5s),
+    # so later requests skip the reconnect and its DNS lookup
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=20, keepalive_expiry=60),
+    http2=HTTP2_AVAILABLE,
+)
+atexit.register(HTTP_CLIENT.close)
+
+# Per-host request slots. The feed, image and profile pools run concurrently,
+# so this bounds the combined load on any one host (the Nitter instance
+# especially); excess requests wait here instead of timing out on the pool.
+_HOST_SLOTS = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Return the semaphore limiting concurrent requests to url's host"""
+    host = urlparse(url).netloc
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return slot
+
+
+def http_get(url: str, **kwargs) -> httpx.Response:
+    """GET url with the shared client once a slot for its host is free"""
+    with _host_slot(url):
+        return HTTP_CLIENT.get(url, **kwargs)
+
+
+class RateLimiter:
+    """Thread-safe token bucket: acquire() only blocks once the burst is used up.
+
+    Tokens refill continuously at `rate` per second up to `burst`, so idle
+    periods are never paid for with fixed sleeps.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting for the bucket to refill if it is empty"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+# Politeness towards the Nitter instance for page requests (media is not throttled)
+NITTER_RATE_LIMITER = RateLimiter(rate=NITTER_PAGES_PER_SECOND, burst=NITTER_PAGES_PER_SECOND)
+
+
+@contextmanager
+def http_stream(url: str, **kwargs):
+    """Stream a GET of url with the shared client, holding a host slot until closed"""
+    with _host_slot(url), HTTP_CLIENT.stream('GET', url, **kwargs) as response:
+        yield response
 
 
 def rewrite_url_for_public(url: Optional[str], internal_base: Optional[str], public_base: Optional[str]) -> Optional[str]:
@@ -42,7 +149,7 @@ def nitter_to_x(url: Optional[str], internal_base: Optional[str]) -> Optional[st
     if not url:
         return url
     if internal_base and url.startswith(internal_base.rstrip('/')):
-        return url.replace(internal_base.rstrip('/'), 'https://x.com', 1)
+        return url.replace(internal_base.rstrip('/'), X_BASE_URL, 1)
     parsed = urlparse(url)
     netloc = parsed.netloc.lower()
     if netloc == 'x.com' or netloc.endswith('.x.com'):
@@ -53,6 +160,12 @@ def nitter_to_x(url: Optional[str], internal_base: Optional[str]) -> Optional[st
     return url
 
 
+@lru_cache(maxsize=32)
+def _zoneinfo(timezone_str: str) -> ZoneInfo:
+    """Return the ZoneInfo for a timezone name, built once per name"""
+    return ZoneInfo(timezone_str)
+
+
 def convert_to_local_timezone(dt: datetime, timezone_str: str) -> datetime:
     """Convert UTC datetime to local timezone"""
     if dt.tzinfo is None:
@@ -60,8 +173,7 @@ def convert_to_local_timezone(dt: datetime, timezone_str: str) -> datetime:
         dt = dt.replace(tzinfo=timezone.utc)
 
     try:
-        local_tz = ZoneInfo(timezone_str)
-        return dt.astimezone(local_tz)
+        return dt.astimezone(_zoneinfo(timezone_str))
     except Exception:
         # Fallback to UTC if timezone conversion fails
         return dt
@@ -86,11 +198,21 @@ class AccountList:
 
 
 class Post:
+    # Fixed attribute set: no per-instance __dict__, and attribute access is a slot lookup
+    __slots__ = (
+        'id', 'tweet_id', 'handle', 'title', 'summary', 'published', 'nitter_url', '_x_url',
+        'image_urls', 'image_paths', 'server_image_urls', 'video_attachments',
+        'profile_pic_url', 'profile_pic_path', 'profile_pic_server_url', 'raw_description',
+        'is_retweet', 'is_reply', 'quote_tweet_url', 'retweet_author',
+        'quote_author', 'quote_text', 'quote_image_urls', 'quote_data',
+    )
+
     def __init__(self, id: str, handle: str, title: str, summary: str, 
                  published: datetime, nitter_url: str, image_urls: List[str] = None,
                  profile_pic_url: str = None, raw_description: str = None,
                  video_attachments: Optional[List[Dict[str, Optional[str]]]] = None):
         self.id = id
+        self.tweet_id = id.rsplit('/', 1)[-1]  # Status id used in image filenames
         self.handle = handle
         self.title = title
         self.summary = summary
@@ -108,7 +230,7 @@ class Post:
         self.raw_description = raw_description or summary
         
         # Parse tweet type and content
-        self.is_retweet = self.title.startswith('RT by @')
+        self.is_retweet = self.title.startswith(RETWEET_TITLE_PREFIX)
         self.is_reply = self.title.startswith('R to @')
         self.quote_tweet_url = self._extract_quote_tweet_url()
         self.retweet_author = self._extract_retweet_author()
@@ -124,7 +246,8 @@ class Post:
     def set_x_url(self, config: Dict):
         """Set the x.com URL by replacing the Nitter base URL"""
         base_url = config.get('nitter', {}).get('base_url', '')
-        self.x_url = self.nitter_url.replace(base_url, 'https://x.com')
+        # Only the leading base can match; an empty base would splice x.com between every character
+        self.x_url = self.nitter_url.replace(base_url, X_BASE_URL, 1) if base_url else self.nitter_url
     
     @property
     def x_url(self):
@@ -182,7 +305,7 @@ class Post:
     def serialize_quote_data_for_db(self):
         """Serialize quote data for database storage"""
         if self.quote_data:
-            return json.dumps(self.quote_data)
+            return _json_dumps(self.quote_data)
         return self.quote_text  # Fallback to legacy text
 
     @staticmethod
@@ -192,14 +315,37 @@ class Post:
             return None
         if quote_text_field.startswith('{'):
             try:
-                return json.loads(quote_text_field)
+                return _json_loads(quote_text_field)
             except json.JSONDecodeError:
                 return None
         return None  # Legacy text format, handled by legacy fields
 
 
+# Elements dropped with their contents when sanitizing a tweet body (others are unwrapped)
+_UNSAFE_CONTENT_TAGS = frozenset({'script', 'style', 'applet', 'iframe', 'object', 'embed', 'noscript'})
+_SAFE_HREF_SCHEMES = frozenset({'', 'http', 'https'})  # '' keeps relative Nitter links
+# Browsers ignore whitespace and control characters inside a URL scheme ("java\tscript:")
+_HREF_IGNORED_CHARS_RE = re.compile(r'[\x00-\x20\x7f]+')
+
+
+def _is_safe_href(href: str) -> bool:
+    """Return True if href is an http(s) or relative link (no javascript:, data:, etc.)"""
+    try:
+        scheme = urlparse(_HREF_IGNORED_CHARS_RE.sub('', href)).scheme
+    except ValueError:
+        return False
+    return scheme.lower() in _SAFE_HREF_SCHEMES
+
+
+@lru_cache(maxsize=8192)
 def format_tweet_body_html(raw_html: Optional[str]) -> str:
-    """Return sanitized HTML for tweet body, preserving full hyperlink targets."""
+    """Return sanitized HTML for tweet body, preserving full hyperlink targets.
+
+    Script-like elements are dropped with their contents and links to
+    anything but http(s) or relative URLs are reduced to their text, since
+    the raw Nitter description is rendered straight into the email.
+    Memoized: the same quoted status body recurs across outer posts and quote trees.
+    """
     if not raw_html:
         return ''
 
@@ -217,9 +363,11 @@ def format_tweet_body_html(raw_html: Optional[str]) -> str:
         # Skip any tag that is no longer attached to the tree to avoid BeautifulSoup unwrap errors.
         if not tag.parent:
             continue
-        if tag.name == 'a':
+        if tag.name in _UNSAFE_CONTENT_TAGS:
+            tag.decompose()
+        elif tag.name == 'a':
             href = tag.get('href')
-            if not href:
+            if not href or not _is_safe_href(href):
                 tag.unwrap()
                 continue
 
@@ -246,7 +394,7 @@ def format_tweet_body_html(raw_html: Optional[str]) -> str:
                 'style': 'color: #1da1f2; text-decoration: none;'
             }
         elif tag.name == 'br':
-            continue
+            tag.attrs = {}
         elif tag.name == 'blockquote':
             # For quoted tweets embedded in the description, drop the whole blockquote
             tag.decompose()
@@ -383,21 +531,66 @@ def parse_account_lists(config: Dict) -> List[AccountList]:
     return account_lists
 
 
+# Status URLs in text (Nitter or X.com format)
+_STATUS_URL_RE = re.compile(r'(https?://[^\s]*status/\d+)')
+
+
 def extract_quote_tweet_url_from_text(text: str) -> Optional[str]:
     """Extract quote tweet URL from plain text content"""
     if not text:
         return None
-    # Look for status URLs in text (Nitter or X.com format)
-    match = re.search(r'(https?://[^\s]*status/\d+)', text)
+    match = _STATUS_URL_RE.search(text)
     return match.group(1) if match else None
 
 
+# Quoted tweets already fetched during this process, keyed by quote URL
+_QUOTE_CONTENT_CACHE: Dict[str, tuple] = {}
+
+
+def _quote_cache_key(quote_url: str) -> str:
+    """Normalize a status URL for caching: lowercase scheme/host, no fragment or trailing slash"""
+    parsed = urlparse(quote_url)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+
+
+def _load_stored_quote(key: str) -> Optional[tuple]:
+    """Return a quote content tuple saved by an earlier run, if still fresh"""
+    stored = get_cached_quote(key, max_age_hours=QUOTE_CACHE_TTL_HOURS)
+    if not stored:
+        return None
+    try:
+        author, text, image_urls, video_attachments, nested_quote_url, published = _json_loads(stored)
+        published = datetime.fromisoformat(published) if published else None
+        image_urls, video_attachments = list(image_urls), [dict(video) for video in video_attachments]
+    except (ValueError, TypeError):
+        # Corrupt or older-shape row: refetch the page, whose result replaces the row
+        return None
+    return author, text, image_urls, video_attachments, nested_quote_url, published
+
+
 def fetch_basic_quote_content(
         quote_url: str, config: Dict, logger=None) -> tuple[Optional[str], Optional[str], List[str], List[Dict[str, Optional[str]]], Optional[str], Optional[datetime]]:
-    """Fetch quoted tweet content from Nitter page and return (author, text, image_urls, video_attachments, nested_quote_url, published)"""
+    """Fetch quoted tweet content from Nitter page and return (author, text, image_urls, video_attachments, nested_quote_url, published)
+
+    Results (including failures, which have already been retried) are cached
+    per normalized quote URL for the rest of the process, so a tweet quoted by
+    several posts is only fetched once; successful ones are also stored in the
+    database for QUOTE_CACHE_TTL_HOURS. Callers get their own copies of the
+    media lists, which download steps annotate.
+    """
     if not quote_url:
         return None, None, [], [], None, None
 
+    cache_key = _quote_cache_key(quote_url)
+    cached = _QUOTE_CONTENT_CACHE.get(cache_key)
+    if cached is None:
+        cached = _load_stored_quote(cache_key)
+        if cached:
+            _QUOTE_CONTENT_CACHE[cache_key] = cached
+    if cached:
+        author, text, image_urls, video_attachments, nested_quote_url, published = cached
+        return author, text, list(image_urls), [dict(video) for video in video_attachments], nested_quote_url, published
+
     try:
         # Use retry decorator for HTTP request with exponential backoff
         @retry(
@@ -406,17 +599,25 @@ def fetch_basic_quote_content(
             retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
         )
         def fetch_quote_page():
-            response = httpx.get(quote_url, timeout=15)
+            NITTER_RATE_LIMITER.acquire()
+            response = http_get(quote_url, timeout=15)
             response.raise_for_status()
             return response
 
         response = fetch_quote_page()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, PAGE_HTML_PARSER)
         base_url = config.get('nitter', {}).get('base_url', '')
 
+        # Every field lives in the main tweet, so later lookups search only its
+        # subtree instead of the whole page (replies, threads, navigation)
+        main_tweet = soup.select_one('.main-tweet')
+        if main_tweet is None:
+            _QUOTE_CONTENT_CACHE[cache_key] = (None, None, [], [], None, None)
+            return None, None, [], [], None, None
+
         # Extract quoted tweet author
         author = None
-        author_elem = soup.select_one('.main-tweet .tweet-header .username')
+        author_elem = main_tweet.select_one('.tweet-header .username')
         if author_elem:
             author = author_elem.get_text().strip()
             # Remove @ if present since we'll add it back in rendering
@@ -426,7 +627,7 @@ def fetch_basic_quote_content(
         # Extract quoted tweet text
         text = None
         nested_quote_url = None
-        text_elem = soup.select_one('.main-tweet .tweet-content')
+        text_elem = main_tweet.select_one('.tweet-content')
         if text_elem:
             quote_links = text_elem.select('a.quote-link')
             for link in quote_links:
@@ -441,15 +642,12 @@ def fetch_basic_quote_content(
 
         # Extract timestamp
         published = None
-        timestamp_elem = soup.select_one('.main-tweet .tweet-header .tweet-date a')
+        timestamp_elem = main_tweet.select_one('.tweet-header .tweet-date a')
         if timestamp_elem:
             timestamp_title = timestamp_elem.get('title')
             if timestamp_title:
-                try:
-                    # Nitter format: "Feb 15, 2025 · 3:45 PM UTC"
-                    published = datetime.strptime(timestamp_title, '%b %d, %Y · %I:%M %p %Z')
-                    published = published.replace(tzinfo=timezone.utc)
-                except ValueError:
+                published = _parse_nitter_timestamp(timestamp_title)
+                if published is None:
                     log_or_print(f"Failed to parse timestamp: {timestamp_title}", 'warning', logger)
 
         # Extract images and video thumbnails from quoted tweet
@@ -457,7 +655,7 @@ def fetch_basic_quote_content(
         video_attachments: List[Dict[str, Optional[str]]] = []
 
         # Images
-        img_elems = soup.select('.main-tweet .attachments .still-image img')
+        img_elems = main_tweet.select('.attachments .still-image img')
         for img in img_elems:
             src = img.get('src')
             if not src:
@@ -468,7 +666,7 @@ def fetch_basic_quote_content(
                 image_urls.append(src)
 
         # Video thumbnails
-        video_imgs = soup.select('.main-tweet .attachments .gallery-video img, .main-tweet .attachments .gif img, .main-tweet .attachments .animated-gif img')
+        video_imgs = main_tweet.select('.attachments .gallery-video img, .attachments .gif img, .attachments .animated-gif img')
         for img in video_imgs:
             src = img.get('src')
             if not src:
@@ -480,7 +678,7 @@ def fetch_basic_quote_content(
             })
 
         # GIFs rendered as <video poster="...">
-        video_tags = soup.select('.main-tweet .attachments video')
+        video_tags = main_tweet.select('.attachments video')
         for vid in video_tags:
             poster = vid.get('poster')
             if not poster:
@@ -491,10 +689,17 @@ def fetch_basic_quote_content(
                 "target_url": quote_url
             })
 
+        _QUOTE_CONTENT_CACHE[cache_key] = (
+            author, text, list(image_urls), [dict(video) for video in video_attachments], nested_quote_url, published)
+        if author or text:
+            cache_quote(cache_key, _json_dumps([
+                author, text, image_urls, video_attachments, nested_quote_url,
+                published.isoformat() if published else None]))
         return author, text, image_urls, video_attachments, nested_quote_url, published
 
     except Exception as e:
         log_or_print(f"Failed to fetch quoted tweet content from {quote_url}: {e}", 'warning', logger)
+        _QUOTE_CONTENT_CACHE[cache_key] = (None, None, [], [], None, None)
         return None, None, [], [], None, None
 
 
@@ -539,11 +744,17 @@ def fetch_quoted_tweet_content_recursive(
     return quote_data
 
 
+# Profile picture URLs already looked up on Nitter during this process
+_PROFILE_PIC_URLS: Dict[str, str] = {}
+
+
 def get_profile_pic_url_from_nitter(handle: str, config: Dict, logger=None) -> Optional[str]:
     """Fetch profile picture URL from Nitter user page"""
     base_url = config.get('nitter', {}).get('base_url')
     if not base_url:
         return None
+    if handle in _PROFILE_PIC_URLS:
+        return _PROFILE_PIC_URLS[handle]
     
     try:
         user_url = f"{base_url}/{handle}"
@@ -555,12 +766,13 @@ def get_profile_pic_url_from_nitter(handle: str, config: Dict, logger=None) -> O
             retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
         )
         def fetch_user_page():
-            response = httpx.get(user_url, timeout=10)
+            NITTER_RATE_LIMITER.acquire()
+            response = http_get(user_url, timeout=10)
             response.raise_for_status()
             return response
 
         response = fetch_user_page()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, PAGE_HTML_PARSER)
         
         # Check if the page contains actual profile content
         profile_card = soup.select_one('.profile-card')
@@ -589,8 +801,9 @@ def get_profile_pic_url_from_nitter(handle: str, config: Dict, logger=None) -> O
         if avatar_img:
             src = avatar_img.get('src')
             if src and src.startswith('/pic/'):
-                return base_url + src
-            elif src:
+                src = base_url + src
+            if src:
+                _PROFILE_PIC_URLS[handle] = src
                 return src
         
         return None
@@ -601,13 +814,27 @@ def get_profile_pic_url_from_nitter(handle: str, config: Dict, logger=None) -> O
 
 
 def download_profile_pic(handle: str, profile_pic_url: str, run_timestamp: str, config: Dict, logger=None) -> tuple[Optional[str], Optional[str]]:
-    """Download profile picture with unique naming and return (local_path, server_url)"""
+    """Download profile picture with unique naming and return (local_path, server_url)
+
+    A picture stored by an earlier run for the same URL is reused without any
+    request while younger than PROFILE_PIC_TTL_HOURS, and after that is
+    revalidated with a conditional GET (reused again on 304 Not Modified).
+    """
     if not profile_pic_url:
         return None, None
     
-    date_folder = datetime.now().strftime('%Y-%m-%d')
-    images_dir = Path(f'images/{date_folder}')
-    images_dir.mkdir(parents=True, exist_ok=True)
+    images_dir = today_images_dir()
+
+    cached = get_cached_profile_pic(handle)
+    if cached and cached['url'] != profile_pic_url:
+        cached = None
+    if cached and cached['server_url'] and cached['age_hours'] < PROFILE_PIC_TTL_HOURS:
+        return cached['path'], cached['server_url']
+    request_headers = {}
+    if cached and cached['etag']:
+        request_headers['If-None-Match'] = cached['etag']
+    if cached and cached['last_modified']:
+        request_headers['If-Modified-Since'] = cached['last_modified']
     
     try:
         # Use retry decorator for HTTP request with exponential backoff
@@ -616,21 +843,36 @@ def download_profile_pic(handle: str, profile_pic_url: str, run_timestamp: str,
             wait=wait_exponential(multiplier=1, min=1, max=10),
             retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
         )
-        def fetch_profile_image():
-            response = httpx.get(profile_pic_url, timeout=10)
-            response.raise_for_status()
-            return response
+        def fetch_profile_image() -> tuple[Optional[Path], httpx.Headers]:
+            # Stream straight to disk; no file (None) means 304 Not Modified
+            with http_stream(profile_pic_url, timeout=10, headers=request_headers) as response:
+                if response.status_code == 304:
+                    return None, response.headers
+                response.raise_for_status()
+                ext = get_image_extension(profile_pic_url, response.headers)
+                # Use run timestamp to ensure uniqueness across runs
+                filepath = images_dir / f"{handle}_profile_{run_timestamp}{ext}"
+                try:
+                    with filepath.open('wb') as f:
+                        f.writelines(response.iter_bytes())
+                except BaseException:
+                    filepath.unlink(missing_ok=True)
+                    raise
+                return filepath, response.headers
+
+        filepath, response_headers = fetch_profile_image()
+        if filepath is None:
+            # Only sent validators when cached, so a 304 always has a stored file
+            server_url = cached['server_url'] or upload_to_image_server(cached['path'], config, logger=logger)
+            # Re-store even when unchanged so the row counts as freshly validated
+            cache_profile_pic(handle, profile_pic_url, cached['etag'], cached['last_modified'], cached['path'], server_url)
+            log_or_print(f"Profile picture for @{handle} unchanged, reusing {cached['path']}", 'info', logger)
+            return cached['path'], server_url
 
-        response = fetch_profile_image()
-        ext = get_image_extension(profile_pic_url, response.headers)
-        # Use run timestamp to ensure uniqueness across runs
-        filename = f"{handle}_profile_{run_timestamp}{ext}"
-        filepath = images_dir / filename
-        
-        filepath.write_bytes(response.content)
-        
         # Upload to image server
         server_url = upload_to_image_server(str(filepath), config, logger=logger)
+        cache_profile_pic(handle, profile_pic_url, response_headers.get('etag'),
+                          response_headers.get('last-modified'), str(filepath), server_url)
 
         log_or_print(f"Downloaded profile picture for @{handle}", 'info', logger)
         return str(filepath), server_url
@@ -640,6 +882,49 @@ def download_profile_pic(handle: str, profile_pic_url: str, run_timestamp: str,
         return None, None
 
 
+# (author, picture URL) -> (local_path, server_url) for pictures fetched during this process
+_FETCHED_PROFILE_PICS: Dict[tuple[str, str], tuple[str, str]] = {}
+
+
+def fetch_profile_pics(authors, known_urls: Dict[str, str], run_timestamp: str, config: Dict, logger=None) -> Dict[str, tuple[str, str]]:
+    """Look up and download profile pictures for several authors concurrently.
+
+    known_urls maps authors to picture URLs already seen in their feeds; other
+    authors (retweeted and quoted accounts) reuse a URL stored within
+    PROFILE_PIC_TTL_HOURS or are looked up on Nitter. Pictures already
+    fetched earlier in the process are not fetched again. Returns
+    {author: (local_path, server_url)} for every author whose picture was
+    downloaded and uploaded.
+    """
+    def fetch_profile_pic(author: str) -> Optional[tuple[str, str]]:
+        # Get profile pic URL (use known URL, a recently stored one, or fetch from Nitter)
+        pic_url = known_urls.get(author)
+        if not pic_url:
+            stored = get_cached_profile_pic(author, max_age_hours=PROFILE_PIC_TTL_HOURS)
+            pic_url = stored['url'] if stored else get_profile_pic_url_from_nitter(author, config, logger)
+        if not pic_url:
+            log_or_print(f"Could not get profile picture URL for @{author}", 'warning', logger)
+            return None
+
+        if (author, pic_url) in _FETCHED_PROFILE_PICS:
+            return _FETCHED_PROFILE_PICS[(author, pic_url)]
+        local_path, server_url = download_profile_pic(author, pic_url, run_timestamp, config, logger)
+        if local_path and server_url:
+            log_or_print(f"Successfully downloaded and stored profile picture for @{author}", 'info', logger)
+            _FETCHED_PROFILE_PICS[(author, pic_url)] = (local_path, server_url)
+            return local_path, server_url
+        log_or_print(f"Failed to download profile picture for @{author}", 'warning', logger)
+        return None
+
+    authors = list(authors)
+    if not authors:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PROFILE_PIC_WORKERS, len(authors))) as executor:
+        results = executor.map(fetch_profile_pic, authors)
+        return {author: pfp for author, pfp in zip(authors, results) if pfp}
+
+
 def extract_all_quote_authors(quote_data: Dict) -> set:
     """Recursively extract all authors from nested quote structure"""
     authors = set()
@@ -661,7 +946,7 @@ def download_quote_images_recursive(post: Post, quote_data: Dict, handle: str, c
     """Recursively download images and video thumbnails for nested quote structure."""
     def download_media_for_quote(quote_data_level: Dict, suffix: str):
         """Download media for a specific quote level"""
-        tweet_id = post.id.split('/')[-1]
+        tweet_id = post.tweet_id
 
         if quote_data_level.get("image_urls"):
             _, server_urls = download_images(
@@ -694,19 +979,53 @@ def download_quote_images_recursive(post: Post, quote_data: Dict, handle: str, c
         depth += 1
 
 
+# Image URL -> (local path, server URL) for downloads started during this process
+# (None entries where a step failed). Only the claiming owner downloads and
+# uploads, so posts sharing an image fetch and place it once even when run concurrently.
+_IMAGE_DOWNLOADS: Dict[str, Future] = {}
+_IMAGE_DOWNLOADS_LOCK = threading.Lock()
+
+
+def _claim_image_download(url: str) -> tuple[Future, bool]:
+    """Return (future, True) if the caller should download url, else the existing (future, False)"""
+    with _IMAGE_DOWNLOADS_LOCK:
+        download = _IMAGE_DOWNLOADS.get(url)
+        if download is not None:
+            return download, False
+        download = _IMAGE_DOWNLOADS[url] = Future()
+        return download, True
+
+
 def download_images(tweet_id: str, handle: str, image_urls: List[str], config: Dict, logger=None) -> tuple[List[str], List[str]]:
     """Download images and return (local_paths, server_urls)"""
     if not image_urls:
         return [], []
     
-    date_folder = datetime.now().strftime('%Y-%m-%d')
-    images_dir = Path(f'images/{date_folder}')
-    images_dir.mkdir(parents=True, exist_ok=True)
-    
-    local_paths = []
-    server_urls = []
+    images_dir = today_images_dir()
     
+    # Media already fetched for another post (retweets, quotes) is reused as-is
+    cached = get_cached_images(image_urls)
+
+    # Claim each distinct URL once (a post may list the same image twice);
+    # images already on the server need neither a download nor an upload
+    results: Dict[str, tuple] = {}
+    owned: Dict[str, tuple[int, Future]] = {}
+    waiting: Dict[str, Future] = {}
     for i, url in enumerate(image_urls):
+        if url in results or url in owned or url in waiting:
+            continue
+        if url in cached and cached[url][1]:
+            results[url] = cached[url]
+            continue
+        download, is_owner = _claim_image_download(url)
+        if is_owner:
+            owned[url] = (i, download)
+        else:
+            waiting[url] = download
+
+    def download_image(i: int, url: str) -> Optional[str]:
+        if url in cached:
+            return cached[url][0]
         try:
             # Use retry decorator for HTTP request with exponential backoff
             @retry(
@@ -715,27 +1034,50 @@ def download_images(tweet_id: str, handle: str, image_urls: List[str], config: D
                 retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
             )
             def fetch_image():
-                response = httpx.get(url, timeout=10)
-                response.raise_for_status()
-                return response
-
-            response = fetch_image()
-            ext = get_image_extension(url, response.headers)
-            filename = f"{handle}_{tweet_id}_{i+1}{ext}"
-            filepath = images_dir / filename
-
-            filepath.write_bytes(response.content)
-            local_paths.append(str(filepath))
-
-            # Upload to image server (append even if None to keep lists aligned)
-            server_url = upload_to_image_server(str(filepath), config, logger=logger)
-            server_urls.append(server_url)
+                # Stream straight to disk rather than buffering the whole body in memory
+                with http_stream(url, timeout=10) as response:
+                    response.raise_for_status()
+                    ext = get_image_extension(url, response.headers)
+                    filename = f"{handle}_{tweet_id}_{i+1}{ext}"
+                    filepath = images_dir / filename
+                    try:
+                        # Write chunks as they arrive; a chunk_size would make httpx re-buffer them
+                        with filepath.open('wb') as f:
+                            f.writelines(response.iter_bytes())
+                    except BaseException:
+                        filepath.unlink(missing_ok=True)
+                        raise
+                return filepath
+
+            return str(fetch_image())
 
         except Exception as e:
             log_or_print(f"Failed to download {url}: {e}", 'warning', logger)
-            local_paths.append(None)
-            server_urls.append(None)
-    
+            return None
+
+    try:
+        if owned:
+            # Fetch all of the post's images at once so latency is max-RTT, not sum-of-RTTs
+            with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_WORKERS, len(owned))) as executor:
+                local_paths = list(executor.map(download_image, [i for i, _ in owned.values()], owned))
+
+            # Upload each file once, even if two URLs resolved to the same local path
+            unique_paths = list(dict.fromkeys(path for path in local_paths if path))
+            server_url_by_path = dict(zip(unique_paths, upload_many(unique_paths, config, logger=logger)))
+            for url, path in zip(owned, local_paths):
+                results[url] = (path, server_url_by_path.get(path))
+            cache_images((url, *results[url]) for url in owned)
+    finally:
+        # Publish owned results before waiting on anyone else's, so two posts
+        # that each own an image the other needs cannot block one another
+        for url, (_, download) in owned.items():
+            download.set_result(results.get(url, (None, None)))
+
+    for url, download in waiting.items():
+        results[url] = download.result()  # Fetched and uploaded by the owning post
+
+    local_paths = [results[url][0] for url in image_urls]
+    server_urls = [results[url][1] for url in image_urls]
     return local_paths, server_urls
 
 
@@ -768,20 +1110,126 @@ def download_video_thumbnails(
     return enriched
 
 
-def fetch_feed(handle: str, window_hours: int, config: Dict, max_posts: int = None, logger=None) -> List[Post]:
-    """Fetch RSS feed for a handle with pagination until we find old non-retweet"""
+_DC_CREATOR_TAG = '{http://purl.org/dc/elements/1.1/}creator'
+_MEDIA_CONTENT_TAG = '{http://search.yahoo.com/mrss/}content'
+
+
+def _parse_rss_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 822 (or ISO 8601) pubDate into an aware UTC datetime (None if unparseable)."""
+    if not value:
+        return None
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            published = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    if published.tzinfo is None:
+        return published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc)
+
+
+_MONTHS = {name: number for number, name in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)}
+
+
+def _parse_nitter_timestamp(value: str) -> Optional[datetime]:
+    """Parse a Nitter status timestamp ("Feb 15, 2025 · 3:45 PM UTC") into an aware UTC datetime.
+
+    The format is fixed, so it is split by hand; anything unexpected falls back
+    to strptime. Returns None if neither can parse it.
+    """
+    try:
+        date_part, time_part = value.split(' · ')
+        month, day, year = date_part.split()
+        clock, meridiem, tz_name = time_part.split()
+        hour, minute = clock.split(':')
+        hour = int(hour)
+        if tz_name in ('UTC', 'GMT') and meridiem in ('AM', 'PM') and 1 <= hour <= 12:
+            hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+            return datetime(int(year), _MONTHS[month], int(day.rstrip(',')), hour, int(minute), tzinfo=timezone.utc)
+    except (KeyError, ValueError):
+        pass
+    try:
+        return datetime.strptime(value, '%b %d, %Y · %I:%M %p %Z').replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def parse_nitter_rss(content: bytes) -> tuple[Optional[str], Iterator[Dict]]:
+    """Parse a Nitter RSS document into (profile_pic_url, entries).
+
+    Nitter's feed layout is fixed, so the document is stream-parsed with
+    ElementTree.iterparse. The profile picture comes from the channel image,
+    which precedes the first item; entries are then parsed lazily as the
+    returned iterator is consumed, so a caller that stops at the first old
+    post skips the rest of the page. Each entry is a dict with title, link,
+    guid, description, author (dc:creator), published (UTC datetime or None)
+    and media_image_urls. Raises ElementTree.ParseError on malformed XML,
+    either here or while iterating the entries.
+    """
+    events = ElementTree.iterparse(BytesIO(content), events=('start', 'end'))
+    profile_pic_url = None
+    channel = None
+    for event, elem in events:
+        if event == 'start' and elem.tag == 'item':
+            break
+        if event == 'start' and elem.tag == 'channel':
+            channel = elem
+        elif event == 'end' and elem.tag == 'image' and profile_pic_url is None:
+            profile_pic_url = elem.findtext('url') or None
+    return profile_pic_url, _iter_rss_entries(events, channel)
+
+
+def _iter_rss_entries(events, channel) -> Iterator[Dict]:
+    """Yield an entry dict for each completed <item> in an iterparse event stream.
+
+    Each item is detached from channel once read, so memory stays flat
+    however many items the page has.
+    """
+    for event, item in events:
+        if event != 'end' or item.tag != 'item':
+            continue
+        entry = {
+            'title': item.findtext('title', '').strip(),
+            'link': item.findtext('link', '').strip(),
+            'guid': item.findtext('guid', '').strip(),
+            'description': item.findtext('description', ''),
+            'author': item.findtext(_DC_CREATOR_TAG, ''),
+            'published': _parse_rss_date(item.findtext('pubDate')),
+            'media_image_urls': [
+                media.get('url') for media in item.iterfind(_MEDIA_CONTENT_TAG)
+                if media.get('type', '').startswith('image/') and media.get('url')
+            ],
+        }
+        item.clear()
+        if channel is not None:
+            channel.remove(item)
+        yield entry
+
+
+def fetch_feed(handle: str, window_hours: int, config: Dict, max_posts: int = None, logger=None,
+               skip_stored: bool = False) -> List[Post]:
+    """Fetch RSS feed for a handle with pagination until we find old non-retweet
+
+    With skip_stored, entries already saved in the database are counted but
+    not returned (or parsed), since only new posts are used downstream.
+    """
     base_url = config.get('nitter', {}).get('base_url')
     if not base_url:
         raise ValueError("NITTER_BASE_URL not set in config")
     
     posts = []
     cutoff_time = datetime.now(timezone.utc) - timedelta(hours=window_hours)
+    stored_ids = stored_post_ids(handle, cutoff_time) if skip_stored else set()
+    stored_count = 0
     cursor = None
     page_count = 0
     max_pages = 10  # Safety limit to prevent infinite loops
     profile_pic_url = None
     
-    log_or_print(f"Fetching RSS pages until we find non-retweet older than {window_hours}h cutoff...", 'info', logger)
+    log_or_print(f"Fetching RSS pages for @{handle} until we find non-retweet older than {window_hours}h cutoff...", 'info', logger)
     
     while page_count < max_pages:
         # Build URL with cursor if we have one
@@ -798,7 +1246,8 @@ def fetch_feed(handle: str, window_hours: int, config: Dict, max_posts: int = No
                 retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
             )
             def fetch_rss_page():
-                response = httpx.get(feed_url, timeout=30)
+                NITTER_RATE_LIMITER.acquire()
+                response = http_get(feed_url, timeout=30)
                 response.raise_for_status()
                 return response
 
@@ -807,94 +1256,87 @@ def fetch_feed(handle: str, window_hours: int, config: Dict, max_posts: int = No
             # Get cursor for next page from min-id header
             next_cursor = response.headers.get('min-id')
 
-            feed = feedparser.parse(response.content)
             page_count += 1
-            
-            if feed.bozo:
-                log_or_print(f"Feed parsing issues for {handle} on page {page_count}", 'warning', logger)
+            feed_image_url, entries = parse_nitter_rss(response.content)
             
             # Extract profile picture from feed metadata (only from first page)
-            if page_count == 1 and hasattr(feed.feed, 'image') and hasattr(feed.feed.image, 'url'):
-                profile_pic_url = feed.feed.image.url
+            if page_count == 1:
+                profile_pic_url = feed_image_url
             
             # Track if we should continue paginating
             should_continue = False
             found_old_non_retweet = False
             hit_max_posts = False
             
-            if not feed.entries:
-                log_or_print(f"No more entries found on page {page_count}", 'info', logger)
-                break
-            
-            for entry in feed.entries:
-                # Parse published date
-                published = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    published = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-                
+            entry = None  # Stays None if the page has no items
+            for entry in entries:
+                published = entry['published']
                 if not published:
                     continue
                 
-                # Extract media from description HTML
-                description = entry.get('description', '')
-                image_urls, video_attachments = parse_media_from_description(
-                    description,
-                    config.get('nitter', {}).get('base_url', '')
-                )
-                
-                # Also check media_content for fallback
-                if hasattr(entry, 'media_content'):
-                    for media in entry.media_content:
-                        if media.get('type', '').startswith('image/'):
-                            image_urls.append(media['url'])
-                
                 # Use guid or link as ID
-                post_id = entry.get('guid', entry.get('link', ''))
+                post_id = entry['guid'] or entry['link']
                 if not post_id:
                     continue
                 
-                # Create post object
-                title = entry.get('title', '')
-                post = Post(
-                    id=post_id,
-                    handle=handle,
-                    title=title,
-                    summary=entry.get('summary', ''),
-                    published=published,
-                    nitter_url=entry.get('link', ''),
-                    image_urls=image_urls,
-                    video_attachments=video_attachments,
-                    profile_pic_url=profile_pic_url,
-                    raw_description=description
-                )
-                post.set_x_url(config)
+                # Decide on the window before building anything for the entry
+                title = entry['title']
+                if published < cutoff_time:
+                    # Check stopping condition: non-retweet older than cutoff
+                    if not title.startswith(RETWEET_TITLE_PREFIX):
+                        found_old_non_retweet = True
+                        log_or_print(f"Found non-retweet from {published.strftime('%Y-%m-%d %H:%M')} (older than cutoff), stopping pagination", 'info', logger)
+                        break
+                    continue  # Old retweet; newer posts may still follow it
                 
-                # Handle retweets - get original author's info
-                if post.is_retweet:
-                    original_author = entry.get('author', '')
-                    if original_author.startswith('@'):
-                        original_author = original_author[1:]  # Remove @ symbol
-                    post.retweet_author = original_author
-                    # Note: Keep profile_pic_url as the retweeter's pic (from feed metadata)
+                if post_id in stored_ids:
+                    # Saved by an earlier run, so main would drop it anyway: count it
+                    # towards max_posts as before, but skip parsing it into a Post
+                    stored_count += 1
+                else:
+                    # Extract media from description HTML
+                    description = entry['description']
+                    image_urls, video_attachments = parse_media_from_description(description, base_url)
                 
-                # Check stopping condition: non-retweet older than cutoff
-                if not post.is_retweet and published < cutoff_time:
-                    found_old_non_retweet = True
-                    log_or_print(f"Found non-retweet from {published.strftime('%Y-%m-%d %H:%M')} (older than cutoff), stopping pagination", 'info', logger)
-                    break
+                    # Also check media:content for fallback
+                    image_urls.extend(entry['media_image_urls'])
+                
+                    # Create post object
+                    post = Post(
+                        id=post_id,
+                        handle=handle,
+                        title=title,
+                        summary=description,
+                        published=published,
+                        nitter_url=entry['link'],
+                        image_urls=image_urls,
+                        video_attachments=video_attachments,
+                        profile_pic_url=profile_pic_url,
+                        raw_description=description
+                    )
+                    post.set_x_url(config)
                 
-                # If tweet is within window, add it to results
-                if published >= cutoff_time:
+                    # Handle retweets - get original author's info
+                    if post.is_retweet:
+                        original_author = entry['author']
+                        if original_author.startswith('@'):
+                            original_author = original_author[1:]  # Remove @ symbol
+                        post.retweet_author = original_author
+                        # Note: Keep profile_pic_url as the retweeter's pic (from feed metadata)
+                
+                    # Tweet is within window, add it to results
                     posts.append(post)
-                    should_continue = True  # Continue looking for more recent tweets
-                    
-                    # Check if we've hit the max posts limit
-                    if max_posts and len(posts) >= max_posts:
-                        hit_max_posts = True
-                        log_or_print(f"Hit max posts limit ({max_posts}), stopping pagination", 'info', logger)
-                        break
+                should_continue = True  # Continue looking for more recent tweets
+                
+                # Check if we've hit the max posts limit
+                if max_posts and len(posts) + stored_count >= max_posts:
+                    hit_max_posts = True
+                    log_or_print(f"Hit max posts limit ({max_posts}), stopping pagination", 'info', logger)
+                    break
+            
+            if entry is None:
+                log_or_print(f"No more entries found on page {page_count}", 'info', logger)
+                break
                 
             # Stop pagination if we found old non-retweet, hit max posts, or no cursor for next page
             if found_old_non_retweet or hit_max_posts or not next_cursor or next_cursor == cursor:
@@ -903,81 +1345,180 @@ def fetch_feed(handle: str, window_hours: int, config: Dict, max_posts: int = No
             cursor = next_cursor
             log_or_print(f"Page {page_count}: found {len([p for p in posts if p.handle == handle])} tweets within window, continuing...", 'info', logger)
             
-            # Be polite - small delay between pages
-            time.sleep(0.1)
-            
+        except ElementTree.ParseError as e:
+            log_or_print(f"Feed parsing issues for {handle} on page {page_count}: {e}", 'warning', logger)
+            break
         except Exception as e:
             log_or_print(f"Error fetching page {page_count} for {handle}: {e}", 'error', logger)
             break
     
     # Filter posts to only this handle (in case of any issues)
     handle_posts = [post for post in posts if post.handle == handle]
-    log_or_print(f"Completed after {page_count} page(s), found {len(handle_posts)} tweets within {window_hours}h window", 'info', logger)
+    log_or_print(f"Completed @{handle} after {page_count} page(s), found {len(handle_posts)} tweets within {window_hours}h window"
+                 + (f" ({stored_count} already stored skipped)" if stored_count else ''), 'info', logger)
     
     return handle_posts
 
 
+def fetch_feeds(feed_requests: List[tuple[str, int]], window_hours: int, config: Dict, logger=None,
+                skip_stored: bool = False) -> Dict[tuple[str, int], List[Post]]:
+    """Fetch RSS feeds concurrently, returning posts keyed by (handle, max_posts)"""
+    unique_requests = list(dict.fromkeys(feed_requests))
+    if not unique_requests:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(unique_requests))) as executor:
+        futures = {
+            (handle, max_posts): executor.submit(fetch_feed, handle, window_hours, config, max_posts, logger=logger, skip_stored=skip_stored)
+            for handle, max_posts in unique_requests
+        }
+    return {key: future.result() for key, future in futures.items()}
+
+
+def enrich_post(post: Post, handle: str, config: Dict, logger=None):
+    """Download a new post's images, video thumbnails and quoted tweets in place"""
+    tweet_id = post.tweet_id
+
+    # Download tweet images and upload to image server
+    if post.image_urls:
+        post.image_paths, post.server_image_urls = download_images(
+            tweet_id, handle, post.image_urls, config, logger)
+
+    # Download video thumbnails and attach server URLs
+    if post.video_attachments:
+        post.video_attachments = download_video_thumbnails(
+            tweet_id, handle, post.video_attachments, config, logger)
+
+    # Fetch quoted tweet content with nested quotes support
+    if post.quote_tweet_url:
+        log_or_print(f"Fetching quoted tweet content from {post.quote_tweet_url}", 'info', logger)
+        quote_data = fetch_quoted_tweet_content_recursive(post.quote_tweet_url, config, max_depth=MAX_QUOTE_DEPTH, logger=logger)
+        post.set_quote_data(quote_data)
+
+        # Download images for all quotes in the nested structure
+        if quote_data:
+            download_quote_images_recursive(post, quote_data, handle, config, logger)
+
+
+def enrich_posts(handle_posts: List[tuple[str, Post]], config: Dict, logger=None):
+    """Run enrich_post for several (handle, post) pairs concurrently.
+
+    Each post's own steps stay in order; different posts overlap, and
+    per-host request slots keep the combined load on Nitter bounded.
+    """
+    if not handle_posts:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_POST_WORKERS, len(handle_posts))) as executor:
+        # list() surfaces any unexpected worker exception here
+        list(executor.map(lambda pair: enrich_post(pair[1], pair[0], config, logger), handle_posts))
+
+
+def stored_post_ids(handle: str, since: datetime) -> set:
+    """Return ids of the handle's saved posts published at or after since (a UTC datetime)"""
+    # published is stored as a UTC isoformat() string, so string order is time order
+    cursor = get_database().execute(
+        'SELECT id FROM tweets WHERE handle = ? AND published >= ?', (handle, since.isoformat()))
+    return {row[0] for row in cursor}
+
+
 def is_new_post(post_id: str) -> bool:
     """Check if post is new (not in database)"""
-    db_path = Path(__file__).parent / 'newsletter.db'
-    with sqlite3.connect(str(db_path)) as conn:
-        cursor = conn.execute('SELECT id FROM tweets WHERE id = ?', (post_id,))
-        return cursor.fetchone() is None
+    cursor = get_database().execute('SELECT id FROM tweets WHERE id = ?', (post_id,))
+    return cursor.fetchone() is None
 
 
 def filter_new_post_ids(post_ids: List[str]) -> set:
     """Return the subset of post_ids that are not already in the database."""
     if not post_ids:
         return set()
-    db_path = Path(__file__).parent / 'newsletter.db'
-    with sqlite3.connect(str(db_path)) as conn:
-        placeholders = ','.join('?' for _ in post_ids)
-        cursor = conn.execute(f'SELECT id FROM tweets WHERE id IN ({placeholders})', post_ids)
-        existing_ids = {row[0] for row in cursor.fetchall()}
-    return set(post_ids) - existing_ids
+    unique_ids = list(dict.fromkeys(post_ids))
+    existing_ids = set()
+    conn = get_database()
+    # Chunk to stay under SQLite's bound-parameter limit (999 on older builds)
+    for start in range(0, len(unique_ids), SQLITE_MAX_PARAMS):
+        chunk = unique_ids[start:start + SQLITE_MAX_PARAMS]
+        placeholders = ','.join('?' * len(chunk))
+        cursor = conn.execute(f'SELECT id FROM tweets WHERE id IN ({placeholders})', chunk)
+        existing_ids.update(row[0] for row in cursor)
+    return set(unique_ids) - existing_ids
+
+
+def filter_new_posts(posts: List[Post]) -> List[Post]:
+    """Return the posts not already in the database, in their original order"""
+    new_ids = filter_new_post_ids([post.id for post in posts])
+    return [post for post in posts if post.id in new_ids]
+
+
+def _json_dumps(value) -> str:
+    """Serialize value to a JSON string for a TEXT column (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _json_loads(text: str):
+    """Parse a JSON TEXT column (orjson when installed; its errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Built once; sqlite3's statement cache then reuses the prepared statement across calls
+_INSERT_TWEET_SQL = '''
+    INSERT OR IGNORE INTO tweets
+    (id, handle, title, summary, published, nitter_url, x_url,
+     image_urls, image_paths, profile_pic_url, profile_pic_path,
+     profile_pic_server_url, server_image_urls, video_attachments, raw_description, is_retweet, is_reply,
+     quote_tweet_url, quote_author, quote_text, quote_image_urls, retweet_author, included_in_newsletter)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _post_db_values(post: Post) -> tuple:
+    """Column values for a post's row in the tweets table"""
+    return (
+        post.id, 
+        post.handle, 
+        post.title, 
+        post.summary, 
+        post.published.isoformat(), 
+        post.nitter_url, 
+        post.x_url,
+        _json_dumps(post.image_urls), 
+        _json_dumps(post.image_paths),
+        post.profile_pic_url, 
+        post.profile_pic_path,
+        post.profile_pic_server_url, 
+        _json_dumps(post.server_image_urls),
+        _json_dumps(post.video_attachments),
+        post.raw_description, 
+        post.is_retweet, 
+        post.is_reply, 
+        post.quote_tweet_url,
+        post.quote_author,
+        post.serialize_quote_data_for_db(),
+        _json_dumps(post.quote_image_urls),
+        post.retweet_author,
+        True  # MVP includes all posts
+    )
 
 
 def save_posts(posts: List[Post]):
     """Save posts to database"""
-    db_path = Path(__file__).parent / 'newsletter.db'
-    with sqlite3.connect(str(db_path)) as conn:
-        for post in posts:
-            # Ensure all values are properly formatted
-            values = (
-                post.id, 
-                post.handle, 
-                post.title, 
-                post.summary, 
-                post.published.isoformat(), 
-                post.nitter_url, 
-                post.x_url,
-                json.dumps(post.image_urls), 
-                json.dumps(post.image_paths),
-                post.profile_pic_url, 
-                post.profile_pic_path,
-                post.profile_pic_server_url, 
-                json.dumps(post.server_image_urls),
-                json.dumps(post.video_attachments),
-                post.raw_description, 
-                post.is_retweet, 
-                post.is_reply, 
-                post.quote_tweet_url,
-                post.quote_author,
-                post.serialize_quote_data_for_db(),
-                json.dumps(post.quote_image_urls),
-                post.retweet_author,
-                True  # MVP includes all posts
-            )
-            
-            conn.execute('''
-                INSERT OR IGNORE INTO tweets
-                (id, handle, title, summary, published, nitter_url, x_url,
-                 image_urls, image_paths, profile_pic_url, profile_pic_path,
-                 profile_pic_server_url, server_image_urls, video_attachments, raw_description, is_retweet, is_reply,
-                 quote_tweet_url, quote_author, quote_text, quote_image_urls, retweet_author, included_in_newsletter)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', values)
-        conn.commit()
+    if not posts:
+        return
+    rows = [_post_db_values(post) for post in posts]
+    # One prepared statement for every row, committed in a single transaction
+    with database_transaction() as conn:
+        conn.executemany(_INSERT_TWEET_SQL, rows)
+
+
+@lru_cache(maxsize=4096)
+def _format_quote_timestamp(published_iso: str, timezone_str: str) -> str:
+    """Format a quote's ISO timestamp for display; memoized since quote trees repeat across posts"""
+    published_dt = datetime.fromisoformat(published_iso)
+    return convert_to_local_timezone(published_dt, timezone_str).strftime(TIMESTAMP_DISPLAY_FORMAT)
 
 
 def render_quote_html_recursive(
@@ -1013,66 +1554,68 @@ def render_quote_html_recursive(
     published_iso = quote_data.get("published")
     if published_iso:
         try:
-            published_dt = datetime.fromisoformat(published_iso)
-            local_dt = convert_to_local_timezone(published_dt, timezone_str)
-            time_str = local_dt.strftime('%I:%M %p · %b %d, %Y')
+            time_str = _format_quote_timestamp(published_iso, timezone_str)
             timestamp_html = f'<div style="color: #657786; font-size: 11px; margin-bottom: 4px;">{time_str}</div>'
         except (ValueError, TypeError):
             pass
 
-    quote_html = f'''
+    quote_parts = [f'''
     <div style="border: 1px solid #e1e8ed; border-radius: 8px; padding: 8px;
                 margin: 8px 0 8px {indent}px; background: #f7f9fa; font-size: {font_size}px;">
         <div style="font-weight: bold; margin-bottom: 4px; display: flex; align-items: center;">
             {profile_pic_html}💬 @{quote_author}
         </div>
         {timestamp_html}
-        <div style="margin-bottom: 6px; white-space: pre-wrap;">{quote_text}</div>'''
+        <div style="margin-bottom: 6px; white-space: pre-wrap;">{quote_text}</div>''']
 
     # Add images if present (prefer server_image_urls, fall back to image_urls)
     display_image_urls = quote_data.get("server_image_urls") or quote_data.get("image_urls")
     if display_image_urls:
-        quote_html += '<div style="margin: 4px 0;">'
-        for img_url in display_image_urls:
-            if img_url:
-                quote_html += f'<img src="{img_url}" style="max-width: 100%; height: auto; border-radius: 4px; margin: 2px 0; display: block;">'
-        quote_html += '</div>'
+        quote_parts.append('<div style="margin: 4px 0;">')
+        quote_parts.extend(
+            f'<img src="{img_url}" style="max-width: 100%; height: auto; border-radius: 4px; margin: 2px 0; display: block;">'
+            for img_url in display_image_urls if img_url
+        )
+        quote_parts.append('</div>')
 
     # Add video thumbnails if present
     video_attachments = quote_data.get("video_attachments") or []
     if video_attachments:
-        quote_html += '<div style="margin: 6px 0;">'
+        quote_parts.append('<div style="margin: 6px 0;">')
         for video_att in video_attachments:
             thumb = video_att.get("thumbnail_server_url") or video_att.get("thumbnail_url")
             target = nitter_to_x(video_att.get("target_url"), nitter_internal_base) or nitter_to_x(quote_data.get("url"), nitter_internal_base) or ""
             if not thumb:
                 continue
-            quote_html += f'''
+            quote_parts.append(f'''
             <a href="{target}" style="position: relative; display: inline-block; text-decoration: none;">
                 <img src="{thumb}" style="max-width: 100%; height: auto; border-radius: 6px; display: block; filter: brightness(0.92);">
                 <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); background: rgba(0,0,0,0.6); border-radius: 999px; padding: 8px 12px; color: white; font-weight: bold; font-size: 13px; display: inline-flex; align-items: center; gap: 6px;">
                     ▶ Video
                 </div>
             </a>
-            '''
-        quote_html += '</div>'
+            ''')
+        quote_parts.append('</div>')
 
     # Recursively render nested quote
     if quote_data.get("nested_quote"):
-        quote_html += render_quote_html_recursive(
+        quote_parts.append(render_quote_html_recursive(
             quote_data["nested_quote"],
             depth + 1,
             author_pfps,
             timezone_str,
             nitter_internal_base,
             nitter_public_base
-        )
+        ))
 
     quote_url = html.escape(rewrite_url_for_public(quote_data.get("url", ""), nitter_internal_base, nitter_public_base) or '')
-    quote_html += f'<div style="margin-top: 4px;"><a href="{quote_url}" style="color: #1da1f2; font-size: 11px;">View original →</a></div>'
-    quote_html += '</div>'
+    quote_parts.append(f'<div style="margin-top: 4px;"><a href="{quote_url}" style="color: #1da1f2; font-size: 11px;">View original →</a></div></div>')
+
+    return ''.join(quote_parts)
+
 
-    return quote_html
+# Initial-letter avatar shown when an author has no uploaded profile picture
+_PROFILE_PIC_PLACEHOLDER_HTML = '<div style="width: 48px; height: 48px; border-radius: 50%; background: #1da1f2; margin-right: 12px; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold; font-size: 18px;">{}</div>'
 
 
 def render_tweet_html(post: Post,
@@ -1108,7 +1651,7 @@ def render_tweet_html(post: Post,
         profile_pic_html = f'<img src="{author_pfp_server_url}" style="width: 48px; height: 48px; border-radius: 50%; margin-right: 12px;">'
     else:
         # Fallback placeholder
-        profile_pic_html = '<div style="width: 48px; height: 48px; border-radius: 50%; background: #1da1f2; margin-right: 12px; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold; font-size: 18px;">{}</div>'.format(html.escape(display_author[0].upper()))
+        profile_pic_html = _PROFILE_PIC_PLACEHOLDER_HTML.format(html.escape(display_author[0].upper()))
     
     
     # Handle quote tweet with recursive rendering
@@ -1138,33 +1681,34 @@ def render_tweet_html(post: Post,
     # Embed images using server URLs
     images_html = ''
     if post.server_image_urls:
-        images_html = '<div style="margin-top: 12px;">'
-        for server_url in post.server_image_urls:
-            images_html += f'<img src="{server_url}" style="max-width: 100%; height: auto; border-radius: 12px; margin: 4px 0; display: block;">'
-        images_html += '</div>'
+        images_html = '<div style="margin-top: 12px;">' + ''.join(
+            f'<img src="{server_url}" style="max-width: 100%; height: auto; border-radius: 12px; margin: 4px 0; display: block;">'
+            for server_url in post.server_image_urls
+        ) + '</div>'
 
     # Embed video thumbnails with play overlay
     videos_html = ''
     if post.video_attachments:
-        videos_html = '<div style="margin-top: 12px;">'
+        video_parts = ['<div style="margin-top: 12px;">']
         for video_att in post.video_attachments:
             thumb = video_att.get("thumbnail_server_url") or video_att.get("thumbnail_url")
             target = nitter_to_x(video_att.get("target_url"), nitter_internal_base) or post.x_url or post.nitter_url
             if not thumb:
                 continue
-            videos_html += f'''
+            video_parts.append(f'''
             <a href="{target}" style="position: relative; display: inline-block; text-decoration: none;">
                 <img src="{thumb}" style="max-width: 100%; height: auto; border-radius: 12px; display: block; filter: brightness(0.92);">
                 <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); background: rgba(0,0,0,0.6); border-radius: 999px; padding: 10px 14px; color: white; font-weight: bold; font-size: 14px; display: inline-flex; align-items: center; gap: 6px;">
                     ▶ Video
                 </div>
             </a>
-            '''
-        videos_html += '</div>'
+            ''')
+        video_parts.append('</div>')
+        videos_html = ''.join(video_parts)
     
     # Format timestamp with timezone conversion
     local_published = convert_to_local_timezone(post.published, timezone_str)
-    time_str = local_published.strftime('%I:%M %p · %b %d, %Y')
+    time_str = local_published.strftime(TIMESTAMP_DISPLAY_FORMAT)
     
     nitter_link = html.escape(rewrite_url_for_public(post.nitter_url, nitter_internal_base, nitter_public_base) or '')
     x_link = html.escape(post.x_url or '')
@@ -1191,6 +1735,30 @@ def render_tweet_html(post: Post,
     '''
 
 
+# Static email skeleton, parsed once at import; only the per-post tweet blocks vary
+_EMAIL_HTML_HEAD = string.Template("""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <title>$title</title>
+    </head>
+    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 600px; margin: 0 auto; background: #f7f9fa; padding: 20px;">
+    <div style="background: white; border-radius: 16px; padding: 24px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
+        <h1 style="color: #14171a; margin: 0 0 24px 0; font-size: 24px;">$header_text</h1>
+        <div style="color: #657786; font-size: 14px; margin-bottom: 24px;">$post_count new posts</div>
+    """)
+_EMAIL_HTML_FOOT = """
+    </div>
+    <div style="text-align: center; margin-top: 20px; color: #657786; font-size: 12px;">
+        Generated by Newsletter System
+    </div>
+    </body>
+    </html>
+    """
+
+
 def render_email(posts: List[Post], account_list: AccountList, author_pfps: Dict[str, tuple[Optional[str], Optional[str]]],
                  timezone_str: str = "UTC",
                  nitter_internal_base: Optional[str] = None,
@@ -1223,10 +1791,8 @@ def render_email(posts: List[Post], account_list: AccountList, author_pfps: Dict
             text_parts.append("")
     else:
         # Multiple accounts - group by handle
-        by_handle = {}
+        by_handle = defaultdict(list)  # Keeps first-seen handle order
         for post in posts:
-            if post.handle not in by_handle:
-                by_handle[post.handle] = []
             by_handle[post.handle].append(post)
         
         for handle, handle_posts in by_handle.items():
@@ -1243,32 +1809,13 @@ def render_email(posts: List[Post], account_list: AccountList, author_pfps: Dict
     text_content = "\n".join(text_parts)
     
     # HTML version with tweet-like formatting
-    html_parts = [f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1">
-        <title>{title}</title>
-    </head>
-    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 600px; margin: 0 auto; background: #f7f9fa; padding: 20px;">
-    <div style="background: white; border-radius: 16px; padding: 24px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-        <h1 style="color: #14171a; margin: 0 0 24px 0; font-size: 24px;">{header_text}</h1>
-        <div style="color: #657786; font-size: 14px; margin-bottom: 24px;">{len(posts)} new posts</div>
-    """]
+    html_parts = [_EMAIL_HTML_HEAD.substitute(title=title, header_text=header_text, post_count=len(posts))]
     
     # Render all tweets chronologically (oldest first)
     for post in sorted(posts, key=lambda p: p.published, reverse=False):
                 html_parts.append(render_tweet_html(post, author_pfps, timezone_str, nitter_internal_base, nitter_public_base))
     
-    html_parts.append("""
-    </div>
-    <div style="text-align: center; margin-top: 20px; color: #657786; font-size: 12px;">
-        Generated by Newsletter System
-    </div>
-    </body>
-    </html>
-    """)
+    html_parts.append(_EMAIL_HTML_FOOT)
     
     html_content = "".join(html_parts)
     
@@ -1344,71 +1891,47 @@ def main(dry_run: bool, window_hours: int = None, no_db: bool = False, recipient
     # Create unique run timestamp for profile picture naming
     run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
+    # Fetch every feed up front, concurrently (limit from account list override or global setting)
+    feed_requests = [
+        (handle, account_list.max_posts or max_per_account)
+        for account_list in account_lists
+        for handle in account_list.accounts
+    ]
+    logger.info(f"Fetching {len(set(feed_requests))} feed(s)...")
+    feeds = fetch_feeds(feed_requests, window_hours, full_config, logger=logger, skip_stored=not no_db)
+    
     # Process each account list separately
     for account_list in account_lists:
         logger.info(f"Processing {account_list.name}")
         
-        # Collect new posts for this account list
-        list_new_posts = []
+        # Select each handle's new posts first so their quoted tweets can be fetched together
+        handle_new_posts = []
         for handle in account_list.accounts:
-            logger.info(f"Fetching feed for @{handle}...")
-            
             # Determine limit (use account list override or global setting)
             limit = account_list.max_posts or max_per_account
             
-            posts = fetch_feed(handle, window_hours, full_config, limit, logger=logger)
+            posts = feeds[(handle, limit)]
             if no_db:
                 new_posts = posts
             else:
-                new_ids = filter_new_post_ids([post.id for post in posts])
-                new_posts = [post for post in posts if post.id in new_ids]
+                new_posts = filter_new_posts(posts)
             
             # Limit should already be enforced during fetch, but double-check
             if len(new_posts) > limit:
                 new_posts = new_posts[:limit]
                 logger.info(f"Post-fetch limited to {limit} posts for @{handle}")
-            
-            # Download images for new posts
-            for post in new_posts:
-                
-                # Download tweet images and upload to image server
-                if post.image_urls:
-                    post.image_paths, post.server_image_urls = download_images(
-                        post.id.split('/')[-1],
-                        handle,
-                        post.image_urls,
-                        full_config,
-                        logger
-                    )
+            handle_new_posts.append((handle, new_posts))
 
-                # Download video thumbnails and attach server URLs
-                if post.video_attachments:
-                    post.video_attachments = download_video_thumbnails(
-                        post.id.split('/')[-1],
-                        handle,
-                        post.video_attachments,
-                        full_config,
-                        logger
-                    )
-                
-                # Fetch quoted tweet content with nested quotes support
-                if post.quote_tweet_url:
-                    logger.info(f"Fetching quoted tweet content from {post.quote_tweet_url}")
-                    quote_data = fetch_quoted_tweet_content_recursive(post.quote_tweet_url, full_config, max_depth=MAX_QUOTE_DEPTH, logger=logger)
-                    post.set_quote_data(quote_data)
-
-                    # Download images for all quotes in the nested structure
-                    if quote_data:
-                        download_quote_images_recursive(post, quote_data, handle, full_config, logger)
-                    
-                    # Small delay to be polite to Nitter instance
-                    time.sleep(0.1)
-            
+        # Download media and quoted tweets for every new post in the list at once
+        enrich_posts(
+            [(handle, post) for handle, new_posts in handle_new_posts for post in new_posts],
+            full_config, logger)
+        
+        # Collect new posts for this account list
+        list_new_posts = []
+        for handle, new_posts in handle_new_posts:
             list_new_posts.extend(new_posts)
             logger.info(f"Found {len(new_posts)} new posts from @{handle}")
-            
-            # Be polite - sleep between feeds
-            time.sleep(0.1)
         
         if not list_new_posts:
             logger.info(f"No new posts found for {account_list.name}")
@@ -1416,7 +1939,6 @@ def main(dry_run: bool, window_hours: int = None, no_db: bool = False, recipient
         
         # Collect all unique authors and download their profile pictures
         unique_authors = set()
-        author_pfps = {}  # author -> (local_path, server_url)
         
         for post in list_new_posts:
             # Add main account
@@ -1435,30 +1957,14 @@ def main(dry_run: bool, window_hours: int = None, no_db: bool = False, recipient
         
         logger.info(f"Downloading profile pictures for {len(unique_authors)} unique authors...")
         
-        # Download profile pictures for all unique authors
-        for author in unique_authors:
-            # For main accounts, we might have the profile pic URL from RSS
-            known_url = None
-            for post in list_new_posts:
-                if post.handle == author and post.profile_pic_url:
-                    known_url = post.profile_pic_url
-                    break
-            
-            # Get profile pic URL (use known URL or fetch from Nitter)
-            pic_url = known_url or get_profile_pic_url_from_nitter(author, full_config, logger)
-            
-            if pic_url:
-                local_path, server_url = download_profile_pic(author, pic_url, run_timestamp, full_config, logger)
-                if local_path and server_url:
-                    author_pfps[author] = (local_path, server_url)
-                    logger.info(f"Successfully downloaded and stored profile picture for @{author}")
-                else:
-                    logger.warning(f"Failed to download profile picture for @{author}")
-            else:
-                logger.warning(f"Could not get profile picture URL for @{author}")
-            
-            # Small delay to be polite to Nitter
-            time.sleep(0.1)
+        # For main accounts, we might have the profile pic URL from RSS
+        known_urls = {}
+        for post in list_new_posts:
+            if post.profile_pic_url:
+                known_urls.setdefault(post.handle, post.profile_pic_url)
+        
+        # Download profile pictures for all unique authors at once
+        author_pfps = fetch_profile_pics(unique_authors, known_urls, run_timestamp, full_config, logger)
         
         # Render email for this account list
         timezone_str = full_config.get('newsletter', {}).get('timezone', 'UTC')